@@ -3,13 +3,34 @@ import bcrypt
 from datetime import datetime, timedelta
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import asyncio
+import hashlib
+import hmac
+import time
 import os
 
+from database import db
+
 # JWT Configuration
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'shield-foundation-secret-key-2024')
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# bcrypt takes 100-300 ms of CPU per call; it runs on a dedicated pool so it never blocks the event loop
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '2'))
+# Calls waiting beyond this are rejected rather than queued indefinitely
+PASSWORD_HASH_MAX_QUEUED = int(os.environ.get('PASSWORD_HASH_MAX_QUEUED', '32'))
+
+# Verified tokens are remembered so repeat requests skip signature and claim checks
+TOKEN_CACHE_MAX_ENTRIES = int(os.environ.get('TOKEN_CACHE_MAX_ENTRIES', '1024'))
+# Logged-out tokens and per-user cutoffs, shared by every worker
+REVOKED_TOKENS_COLLECTION = "revoked_tokens"
+
+# Long-lived bearer token for Prometheus scrapers; unset means admin JWTs only
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 security = HTTPBearer()
 
 def hash_password(password: str) -> str:
@@ -22,35 +43,204 @@ def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+class PasswordHashPool:
+    """Bounded thread pool for bcrypt work with its own concurrency limit and queue metrics"""
+
+    def __init__(self, workers: int, max_queued: int):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._semaphore = None
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.run_seconds_total = 0.0
+
+    async def run(self, func, *args):
+        """Run func(*args) on the pool once a worker slot is free"""
+        if self.queued >= self.max_queued:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent login attempts, please retry shortly",
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        queued_at = time.perf_counter()
+        self.queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        started_at = time.perf_counter()
+        self.wait_seconds_total += started_at - queued_at
+        self.active += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.active -= 1
+            self.completed += 1
+            self.run_seconds_total += time.perf_counter() - started_at
+            self._semaphore.release()
+
+    def metrics(self) -> dict:
+        return {
+            "workers": self.workers,
+            "active": self.active,
+            "queued": self.queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_seconds_total": self.wait_seconds_total,
+            "run_seconds_total": self.run_seconds_total,
+        }
+
+password_hash_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUED)
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password using bcrypt without blocking the event loop"""
+    return await password_hash_pool.run(hash_password, password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    return await password_hash_pool.run(verify_password, password, hashed)
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified, unrevoked token digests mapped to their decoded claims.
+
+    Entries expire at the token's own exp claim. Revocations live in the
+    revoked_tokens collection: revoking evicts the entries on this worker,
+    and cache sync clears the cache on the others, so their next request
+    checks the collection again.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Bumped on every eviction so a check in flight never caches a token revoked meanwhile
+        self.generation = 0
+
+    def get(self, digest: str):
+        payload = self._entries.get(digest)
+        if payload is None:
+            return None
+        if payload.get("exp", 0) <= time.time():
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return payload
+
+    def put(self, digest: str, payload: dict):
+        self._entries[digest] = payload
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict(self, digest: str):
+        self.generation += 1
+        self._entries.pop(digest, None)
+
+    def evict_user(self, username: str):
+        self.generation += 1
+        for digest in [d for d, p in self._entries.items() if p.get("sub") == username]:
+            del self._entries[digest]
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+
+token_cache = VerifiedTokenCache(TOKEN_CACHE_MAX_ENTRIES)
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
 def create_access_token(data: dict) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-    to_encode.update({"exp": expire})
+    # Fractional iat so revoke_user_tokens can tell apart tokens issued in the same second
+    to_encode.update({"exp": expire, "iat": time.time()})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str) -> dict:
-    """Verify and decode a JWT token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+def revocation_query(digest: str, payload: dict) -> dict:
+    """Match a revocation of this token, or a cutoff for its user later than its iat"""
+    return {"$or": [
+        {"digest": digest},
+        {"username": payload.get("sub"), "issued_before": {"$gt": payload.get("iat", 0)}},
+    ]}
+
+async def verify_token(token: str) -> dict:
+    """Verify and decode a JWT token, reusing the result of earlier verifications"""
+    digest = token_digest(token)
+    payload = token_cache.get(digest)
+    if payload is not None:
         return payload
+    payload = decode_token(token)
+    generation = token_cache.generation
+    if await db[REVOKED_TOKENS_COLLECTION].find_one(revocation_query(digest, payload), projection={"_id": 1}):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if generation == token_cache.generation:
+        token_cache.put(digest, payload)
+    return payload
+
+def decode_token(token: str) -> dict:
+    """Check a JWT token's signature and claims and return its payload"""
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+async def revoke_token(token: str):
+    """Reject a token from now on, e.g. on logout"""
+    payload = await verify_token(token)
+    digest = token_digest(token)
+    now = datetime.utcnow()
+    # Kept until the token would have expired anyway; the TTL index on exp removes it then
+    await db[REVOKED_TOKENS_COLLECTION].update_one(
+        {"digest": digest},
+        {"$set": {"digest": digest, "username": payload.get("sub"),
+                  "exp": datetime.utcfromtimestamp(payload.get("exp", time.time())), "updated_at": now}},
+        upsert=True
+    )
+    token_cache.evict(digest)
+
+async def revoke_user_tokens(username: str):
+    """Reject every token issued to a user so far, e.g. after a password change"""
+    now = datetime.utcnow()
+    await db[REVOKED_TOKENS_COLLECTION].update_one(
+        {"username": username, "digest": {"$exists": False}},
+        {"$set": {
+            "username": username,
+            "issued_before": time.time(),
+            # Every token issued before the cutoff has expired by then
+            "exp": now + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS),
+            "updated_at": now,
+        }},
+        upsert=True
+    )
+    token_cache.evict_user(username)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get the current authenticated user from JWT token"""
-    payload = verify_token(credentials.credentials)
+    payload = await verify_token(credentials.credentials)
     username: str = payload.get("sub")
     if username is None:
         raise HTTPException(
@@ -68,4 +258,11 @@ async def admin_required(current_user: dict = Depends(get_current_user)):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+# Dependency for the metrics endpoint
+async def metrics_required(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Accept the static scrape token or an admin JWT"""
+    if METRICS_TOKEN and hmac.compare_digest(credentials.credentials.encode(), METRICS_TOKEN.encode()):
+        return {"username": "metrics", "role": "metrics"}
+    return await admin_required(await get_current_user(credentials))
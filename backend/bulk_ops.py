@@ -0,0 +1,217 @@
+from pymongo.errors import PyMongoError
+from datetime import datetime
+import asyncio
+import os
+import time
+import uuid
+import logging
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+# Documents updated or deleted per round trip, so a large selection never holds one long write
+BULK_BATCH_SIZE = int(os.environ.get('BULK_BATCH_SIZE', '1000'))
+# Selections up to this size finish within the request; larger ones run as a background job
+BULK_INLINE_LIMIT = int(os.environ.get('BULK_INLINE_LIMIT', '5000'))
+# Job progress is stored here so any worker can answer a poll; finished jobs expire by TTL index
+BULK_JOBS_COLLECTION = "bulk_jobs"
+
+
+def id_query(ids: list) -> dict:
+    """Match documents by our UUID id, the one key contacts and volunteers are addressed by.
+
+    Legacy documents created without an id are not matched; select them
+    with a filter instead, which walks the collection by _id.
+    """
+    return {"id": {"$in": ids}}
+
+
+def filter_query(selection_filter: dict) -> dict:
+    """MongoDB query for a BulkFilter: exact status/email/inquiry_type, created_at range"""
+    query = {}
+    for field in ("status", "email", "inquiry_type"):
+        if selection_filter.get(field) is not None:
+            query[field] = selection_filter[field]
+    created_at = {}
+    if selection_filter.get("created_after") is not None:
+        created_at["$gte"] = selection_filter["created_after"]
+    if selection_filter.get("created_before") is not None:
+        created_at["$lt"] = selection_filter["created_before"]
+    if created_at:
+        query["created_at"] = created_at
+    return query
+
+
+class BulkJob:
+    """Progress of one bulk update or delete over a selection of documents"""
+
+    def __init__(self, collection_name: str, action: str, username: str):
+        self.id = uuid.uuid4().hex
+        self.collection_name = collection_name
+        self.action = action
+        self.username = username
+        self.state = "running"
+        self.total = 0
+        self.processed = 0
+        self.affected = 0
+        self.error = None
+        self.started_at = datetime.utcnow()
+        self.finished_at = None
+        self.task = None
+
+    @classmethod
+    def from_document(cls, document: dict) -> "BulkJob":
+        job = cls(document["collection"], document["action"], document["username"])
+        job.id = document["id"]
+        for field in ("state", "total", "processed", "affected", "error", "started_at", "finished_at"):
+            setattr(job, field, document.get(field))
+        return job
+
+    def to_document(self) -> dict:
+        return {
+            "id": self.id,
+            "collection": self.collection_name,
+            "action": self.action,
+            "username": self.username,
+            "state": self.state,
+            "total": self.total,
+            "processed": self.processed,
+            "affected": self.affected,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "updated_at": datetime.utcnow(),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "collection": self.collection_name,
+            "action": self.action,
+            "state": self.state,
+            "total": self.total,
+            "processed": self.processed,
+            "affected": self.affected,
+            "progress": round(self.processed / self.total, 4) if self.total else 1.0,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class BulkOperations:
+    """Runs bulk status updates and deletes in bounded batches and tracks their progress.
+
+    An ID list is processed in chunks of batch_size IDs. A filter is walked
+    by _id in pages of batch_size, re-checking the filter on write so
+    documents that changed in between are left alone. Progress is saved to
+    the bulk_jobs collection after every batch; only the tasks of jobs
+    running on this worker are kept in memory.
+    """
+
+    def __init__(self, batch_size: int = BULK_BATCH_SIZE, inline_limit: int = BULK_INLINE_LIMIT):
+        self.batch_size = batch_size
+        self.inline_limit = inline_limit
+        # job id -> job still running on this worker
+        self._jobs = {}
+
+    async def get(self, job_id: str):
+        """A job started on any worker, or None"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        document = await db[BULK_JOBS_COLLECTION].find_one({"id": job_id}, projection={"_id": 0})
+        return BulkJob.from_document(document) if document else None
+
+    def running(self) -> int:
+        return len(self._jobs)
+
+    async def run(self, collection_name: str, action: str, username: str, ids: list = None,
+                  query: dict = None, update: dict = None, on_finish=None) -> BulkJob:
+        """Start a job over `ids` or `query`; returns it finished, or running in the background when large.
+
+        Without update, the selected documents are deleted. on_finish is
+        called once the job stops, however it ends.
+        """
+        job = BulkJob(collection_name, action, username)
+        collection = db[collection_name]
+        if ids is not None:
+            ids = list(dict.fromkeys(ids))
+            job.total = len(ids)
+        else:
+            job.total = await collection.count_documents(query)
+        await self._save(job)
+
+        work = self._apply(job, collection, ids, query, update, on_finish)
+        if job.total <= self.inline_limit:
+            await work
+        else:
+            self._jobs[job.id] = job
+            job.task = asyncio.create_task(work)
+            logger.info(f"Bulk {action} of {job.total} {collection_name} started as job {job.id} by {username}")
+        return job
+
+    async def _apply(self, job: BulkJob, collection, ids: list, query: dict, update: dict, on_finish=None):
+        started = time.perf_counter()
+        try:
+            async for batch_query, size in self._batches(collection, ids, query):
+                if update is not None:
+                    result = await collection.update_many(batch_query, update)
+                    job.affected += result.modified_count
+                else:
+                    result = await collection.delete_many(batch_query)
+                    job.affected += result.deleted_count
+                job.processed += size
+                await self._save(job)
+            job.state = "done"
+        except Exception as e:
+            job.state = "failed"
+            job.error = str(e)
+            logger.error(f"Bulk {job.action} job {job.id} on {job.collection_name} failed: {e}")
+        finally:
+            if job.state == "running":
+                job.state = "cancelled"
+            job.processed = min(job.processed, job.total)
+            job.finished_at = datetime.utcnow()
+            job.task = None
+            self._jobs.pop(job.id, None)
+            if on_finish is not None:
+                on_finish()
+            try:
+                await self._save(job)
+            except PyMongoError as e:
+                logger.error(f"Failed to save final state of bulk job {job.id}: {e}")
+        logger.info(f"Bulk {job.action} on {job.collection_name} by {job.username}: {job.affected} of "
+                    f"{job.total} documents in {time.perf_counter() - started:.2f}s")
+
+    async def _batches(self, collection, ids: list, query: dict):
+        """Yield (query, selection size) per batch"""
+        if ids is not None:
+            for start in range(0, len(ids), self.batch_size):
+                chunk = ids[start:start + self.batch_size]
+                yield id_query(chunk), len(chunk)
+            return
+
+        last_id = None
+        while True:
+            page_query = dict(query) if last_id is None else {"$and": [query, {"_id": {"$gt": last_id}}]}
+            documents = await collection.find(page_query, projection={"_id": 1}) \
+                .sort("_id", 1).limit(self.batch_size).to_list(self.batch_size)
+            if not documents:
+                return
+            last_id = documents[-1]["_id"]
+            yield {"$and": [query, {"_id": {"$in": [document["_id"] for document in documents]}}]}, len(documents)
+
+    async def _save(self, job: BulkJob):
+        await db[BULK_JOBS_COLLECTION].replace_one({"id": job.id}, job.to_document(), upsert=True)
+
+    async def stop(self):
+        """Cancel jobs still running; what they already applied stays applied"""
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+bulk_operations = BulkOperations()
@@ -0,0 +1,233 @@
+from fastapi import Request
+from fastapi.responses import Response
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import asyncio
+import hashlib
+import os
+import time
+import logging
+
+from serialization import dumps
+from compression import precompress, negotiate
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are reloaded even without an invalidation (0 disables expiry)
+CACHE_TTL_SECONDS = float(os.environ.get('PUBLIC_CACHE_TTL_SECONDS', '300'))
+# Upper bound on cached entries; keys such as page names come from the URL
+CACHE_MAX_ENTRIES = int(os.environ.get('PUBLIC_CACHE_MAX_ENTRIES', '1024'))
+
+
+class CacheEntry:
+    """A serialized JSON response body held in the cache, with its validators.
+
+    variants holds the body precompressed per content coding, produced once
+    when the entry is filled.
+    """
+
+    def __init__(self, body: bytes, last_modified: datetime = None, variants: dict = None):
+        self.body = body
+        self.variants = variants or {}
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = '"' + self.digest + '"'
+        # HTTP dates have one-second resolution
+        self.last_modified = last_modified or datetime.now(timezone.utc).replace(microsecond=0)
+        self.created_at = time.monotonic()
+        self.stale = False
+
+    def etag_for(self, encoding: str = None) -> str:
+        """Each coding is a different representation, so it gets its own strong ETag"""
+        return self.etag if encoding is None else f'"{self.digest}-{encoding}"'
+
+    def matches(self, tag: str) -> bool:
+        return tag == self.etag or any(tag == self.etag_for(encoding) for encoding in self.variants)
+
+    def is_fresh(self, ttl: float) -> bool:
+        if self.stale:
+            return False
+        return ttl <= 0 or (time.monotonic() - self.created_at) <= ttl
+
+
+class ResponseCache:
+    """In-process cache of public response bodies, keyed by (collection, key).
+
+    Entries are grouped by the collection they are built from so an admin
+    write to that collection can evict every dependent entry at once.
+    Evicted entries are kept as stale until replaced, so a reload that
+    produces the same body keeps its original Last-Modified.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._locks = {}
+        # Bumped on every invalidation so in-flight loads never store stale data
+        self._generations = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, collection: str, key=None):
+        cache_key = (collection, key)
+        entry = self._entries.get(cache_key)
+        if entry is None or not entry.is_fresh(self.ttl):
+            return None
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def set(self, collection: str, key, body: bytes, variants: dict = None,
+            last_modified: datetime = None) -> CacheEntry:
+        cache_key = (collection, key)
+        entry = self.build_entry(collection, key, body, variants, last_modified)
+        self._entries[cache_key] = entry
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._locks.pop(evicted, None)
+        return entry
+
+    def build_entry(self, collection: str, key, body: bytes, variants: dict = None,
+                    last_modified: datetime = None) -> CacheEntry:
+        entry = CacheEntry(body, last_modified, variants)
+        previous = self._entries.get((collection, key))
+        if last_modified is None and previous is not None and previous.etag == entry.etag:
+            entry.last_modified = previous.last_modified
+        return entry
+
+    def generation(self, collection: str) -> int:
+        return self._generations.get(collection, 0)
+
+    def invalidate(self, *collections: str):
+        """Evict every cached entry built from the given collections"""
+        for collection in collections:
+            self._generations[collection] = self.generation(collection) + 1
+        for (collection, _), entry in self._entries.items():
+            if collection in collections:
+                entry.stale = True
+        logger.debug(f"Response cache invalidated: {', '.join(collections)}")
+
+    def clear(self):
+        self.invalidate(*{collection for collection, _ in self._entries})
+
+    def lock(self, collection: str, key=None) -> asyncio.Lock:
+        cache_key = (collection, key)
+        if cache_key not in self._locks:
+            self._locks[cache_key] = asyncio.Lock()
+        return self._locks[cache_key]
+
+    async def fetch(self, collection: str, key, loader) -> CacheEntry:
+        """Return the entry for (collection, key), calling loader() on a miss.
+
+        Concurrent misses for the same key share a single load.
+        """
+        entry = self.get(collection, key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        async with self.lock(collection, key):
+            entry = self.get(collection, key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            generation = self.generation(collection)
+            payload = await loader()
+            body = serialize(payload)
+            # Compressed once per fill, off the event loop; zlib and brotli release the GIL
+            variants = await asyncio.to_thread(precompress, body)
+            if generation != self.generation(collection):
+                # Invalidated while loading; serve the result but don't keep it
+                return self.build_entry(collection, key, body, variants)
+            return self.set(collection, key, body, variants)
+
+
+def serialize(payload) -> bytes:
+    """Serialize a payload with the configured JSON serializer"""
+    return dumps(payload)
+
+
+def is_not_modified(request: Request, entry: CacheEntry) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against a cache entry"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 7232)
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(entry.matches(tag.removeprefix("W/")) for tag in tags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return entry.last_modified <= since
+    return False
+
+
+def entry_headers(entry: CacheEntry, encoding: str = None) -> dict:
+    headers = {
+        "ETag": entry.etag_for(encoding),
+        "Last-Modified": format_datetime(entry.last_modified, usegmt=True),
+        # Let browsers and proxies store the body but revalidate on each use
+        "Cache-Control": "public, no-cache",
+    }
+    if entry.variants:
+        headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return headers
+
+
+response_cache = ResponseCache()
+
+# Pseudo-collection for assembled bundles; their keys change whenever a member changes
+BUNDLE_COLLECTION = "_bundles"
+
+
+async def cached_response(collection: str, key, loader, request: Request) -> Response:
+    """Serve a public GET response from the cache, loading it on a miss.
+
+    Answers conditional requests with 304 when the client's copy is current.
+    """
+    entry = await response_cache.fetch(collection, key, loader)
+    return conditional_response(entry, request)
+
+
+async def cached_bundle(parts, request: Request) -> Response:
+    """Serve several cached responses as one JSON object keyed by collection.
+
+    parts is a list of (collection, key, loader); missing entries are loaded
+    concurrently. The bundle's ETag covers every part, so a change to any of
+    the included collections produces a new version.
+    """
+    entries = await asyncio.gather(
+        *(response_cache.fetch(collection, key, loader) for collection, key, loader in parts)
+    )
+    # Assembled bundles are cached by their members' versions, so each is built and compressed once
+    bundle_key = tuple((collection, entry.etag) for (collection, _, _), entry in zip(parts, entries))
+    bundle = response_cache.get(BUNDLE_COLLECTION, bundle_key)
+    if bundle is None:
+        body = b"{" + b",".join(
+            b'"' + collection.encode() + b'":' + entry.body
+            for (collection, _, _), entry in zip(parts, entries)
+        ) + b"}"
+        variants = await asyncio.to_thread(precompress, body)
+        bundle = response_cache.set(BUNDLE_COLLECTION, bundle_key, body, variants,
+                                    last_modified=max(entry.last_modified for entry in entries))
+    return conditional_response(bundle, request)
+
+
+def conditional_response(entry: CacheEntry, request: Request) -> Response:
+    encoding = negotiate(request.headers.get("accept-encoding"), entry.variants)
+    headers = entry_headers(entry, encoding)
+    if is_not_modified(request, entry):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    body = entry.variants[encoding] if encoding else entry.body
+    return Response(content=body, media_type="application/json", headers=headers)
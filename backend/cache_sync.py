@@ -0,0 +1,117 @@
+from pymongo.errors import OperationFailure, PyMongoError
+import asyncio
+import os
+import logging
+
+from cache import response_cache
+from auth import token_cache, REVOKED_TOKENS_COLLECTION
+
+logger = logging.getLogger(__name__)
+
+# Collections whose writes must evict cached public responses on every worker
+CMS_COLLECTIONS = [
+    "site_content",
+    "success_stories",
+    "leadership_team",
+    "page_sections",
+    "gallery_items",
+    "news",
+    "impact_stats",
+]
+
+# Collections synced: CMS content, plus token revocations for the verified-token cache
+SYNCED_COLLECTIONS = CMS_COLLECTIONS + [REVOKED_TOKENS_COLLECTION]
+
+POLL_INTERVAL_SECONDS = float(os.environ.get('CACHE_SYNC_POLL_SECONDS', '5'))
+RETRY_DELAY_SECONDS = 5
+
+# Server error codes meaning change streams are not supported by this deployment
+CHANGE_STREAM_UNSUPPORTED_CODES = {40573, 40324, 136}
+
+
+def evict(collection: str):
+    """Drop what this worker cached from a collection another worker changed"""
+    if collection == REVOKED_TOKENS_COLLECTION:
+        # Verified tokens are re-checked against the revocation list on their next use
+        token_cache.clear()
+    else:
+        response_cache.invalidate(collection)
+
+
+def clear_all():
+    """Changes may have been missed; drop everything cached"""
+    response_cache.clear()
+    token_cache.clear()
+
+
+async def watch_change_stream(db):
+    """Evict cached entries for each change reported by a database change stream"""
+    pipeline = [{"$match": {"$or": [
+        {"ns.coll": {"$in": SYNCED_COLLECTIONS}},
+        {"operationType": {"$in": ["dropDatabase", "invalidate"]}},
+    ]}}]
+    async with db.watch(pipeline) as stream:
+        logger.info("Cache sync: watching CMS collections and token revocations via change stream")
+        async for change in stream:
+            collection = change.get("ns", {}).get("coll")
+            if collection:
+                evict(collection)
+            else:
+                clear_all()
+
+
+async def collection_watermark(db, collection_name: str):
+    """Return a value that changes whenever documents in the collection change"""
+    latest = await db[collection_name].find_one(
+        {}, projection={"updated_at": 1, "_id": 0}, sort=[("updated_at", -1)]
+    )
+    # The count catches deletes, which never move the updated_at maximum
+    count = await db[collection_name].estimated_document_count()
+    return (latest.get("updated_at") if latest else None, count)
+
+
+async def poll_watermarks(db, interval: float = POLL_INTERVAL_SECONDS):
+    """Fallback for deployments without change streams: poll updated_at watermarks"""
+    logger.info(f"Cache sync: polling CMS and revocation watermarks every {interval}s")
+    watermarks = {}
+    while True:
+        current = await asyncio.gather(
+            *(collection_watermark(db, name) for name in SYNCED_COLLECTIONS)
+        )
+        for name, watermark in zip(SYNCED_COLLECTIONS, current):
+            if name in watermarks and watermarks[name] != watermark:
+                evict(name)
+            watermarks[name] = watermark
+        await asyncio.sleep(interval)
+
+
+async def run_cache_sync(db):
+    """Keep this worker's response and token caches in step with writes made by other workers"""
+    while True:
+        try:
+            await watch_change_stream(db)
+        except asyncio.CancelledError:
+            raise
+        except OperationFailure as e:
+            if e.code not in CHANGE_STREAM_UNSUPPORTED_CODES:
+                logger.warning(f"Cache sync change stream failed, retrying: {e}")
+                clear_all()
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                continue
+            logger.info(f"Change streams unavailable ({e.code}), falling back to polling")
+            break
+        except PyMongoError as e:
+            # Changes may have been missed while disconnected
+            logger.warning(f"Cache sync change stream interrupted, retrying: {e}")
+            clear_all()
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+    while True:
+        try:
+            await poll_watermarks(db)
+        except asyncio.CancelledError:
+            raise
+        except PyMongoError as e:
+            logger.warning(f"Cache sync polling failed, retrying: {e}")
+            clear_all()
+            await asyncio.sleep(RETRY_DELAY_SECONDS)
@@ -0,0 +1,129 @@
+from starlette.datastructures import Headers, MutableHeaders
+import gzip
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # brotli is in requirements.txt; gzip alone still works
+    brotli = None
+
+# Bodies smaller than this go out uncompressed; the framing overhead isn't worth it
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', '1024'))
+# Per-request compression favours speed; cached bodies are compressed once, so favour size
+DYNAMIC_GZIP_LEVEL = 5
+DYNAMIC_BROTLI_QUALITY = 4
+PRECOMPRESS_GZIP_LEVEL = 9
+PRECOMPRESS_BROTLI_QUALITY = 9
+
+# Preferred first when the client weights encodings equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=PRECOMPRESS_BROTLI_QUALITY if precompress else DYNAMIC_BROTLI_QUALITY)
+    # mtime=0 keeps the output, and so its ETag, stable for identical bodies
+    return gzip.compress(body, compresslevel=PRECOMPRESS_GZIP_LEVEL if precompress else DYNAMIC_GZIP_LEVEL, mtime=0)
+
+
+def precompress(body: bytes) -> dict:
+    """Compressed variants of a body worth serving, by content coding"""
+    if len(body) < COMPRESSION_MIN_BYTES:
+        return {}
+    variants = {}
+    for encoding in ENCODINGS:
+        compressed = compress(body, encoding, precompress=True)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+
+def negotiate(accept_encoding: str, available) -> str:
+    """Pick the best content coding in `available` for an Accept-Encoding value, or None"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing single-body responses with brotli or gzip.
+
+    Responses that already carry a Content-Encoding (such as precompressed
+    cache entries), streamed responses and small or non-text bodies pass
+    through unchanged.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), ENCODINGS)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        decided = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, decided
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or decided:
+                await send(message)
+                return
+
+            decided = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            content_type = headers.get("content-type", "")
+            if (message.get("more_body", False)
+                    or "content-encoding" in headers
+                    or len(body) < self.minimum_size
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)):
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                # Same content, different bytes: a strong validator no longer applies
+                headers["ETag"] = "W/" + headers["etag"]
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+        if start_message is not None and not decided:
+            # Response without a body message (e.g. 304 handled upstream)
+            await send(start_message)
@@ -0,0 +1,152 @@
+from fastapi import HTTPException
+
+# Media types a PATCH body may declare; without one, a list is JSON Patch and an object merge-patch
+JSON_PATCH_TYPE = "application/json-patch+json"
+MERGE_PATCH_TYPE = "application/merge-patch+json"
+
+
+class ContentUpdate:
+    """Targeted MongoDB update built from a patch: $set / $unset / $push by dotted path.
+
+    conditions holds JSON Patch "test" operations and the paths operations
+    require as filter clauses, so the update only applies while they hold.
+    """
+
+    def __init__(self, prefix: str = "content"):
+        self.prefix = prefix
+        self.set = {}
+        self.unset = {}
+        self.push = {}
+        self.conditions = {}
+
+    @property
+    def paths(self) -> list:
+        return [*self.set, *self.unset, *self.push]
+
+    def path(self, tokens: list) -> str:
+        for token in tokens:
+            # MongoDB reads dots as nesting and reserves $-prefixed names
+            if not token or "." in token or token.startswith("$"):
+                raise HTTPException(status_code=400, detail=f"Unsupported path segment: {token!r}")
+        return ".".join([self.prefix, *tokens])
+
+    def require(self, tokens: list):
+        """Make the update conditional on a path existing; the content root itself may always be created"""
+        if tokens:
+            # A test on the same path already implies it exists
+            self.conditions.setdefault(self.path(tokens), {"$exists": True})
+
+    def check_conflicts(self):
+        """MongoDB rejects one update touching a path twice, or both a path and its parent"""
+        seen = set()
+        for path in sorted(self.paths):
+            if path in seen:
+                raise HTTPException(status_code=400, detail=f"Conflicting patch paths: {path}, {path}")
+            seen.add(path)
+        for path in sorted(seen):
+            keys = path.split(".")
+            # Sorting alone misses e.g. a and a.b with a-x between them, so test every prefix
+            for depth in range(1, len(keys)):
+                parent = ".".join(keys[:depth])
+                if parent in seen:
+                    raise HTTPException(status_code=400, detail=f"Conflicting patch paths: {parent}, {path}")
+
+    def document(self, extra_set: dict = None) -> dict:
+        update = {}
+        if self.set or extra_set:
+            update["$set"] = {**self.set, **(extra_set or {})}
+        if self.unset:
+            update["$unset"] = {path: "" for path in self.unset}
+        if self.push:
+            update["$push"] = self.push
+        return update
+
+
+def parse_pointer(pointer: str) -> list:
+    """Split a JSON Pointer (RFC 6901) into unescaped reference tokens"""
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise HTTPException(status_code=400, detail=f"Invalid JSON Pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def from_merge_patch(patch: dict, prefix: str = "content") -> ContentUpdate:
+    """Translate a JSON merge-patch (RFC 7386) object: null removes a key, objects merge, anything else replaces"""
+    update = ContentUpdate(prefix)
+
+    def walk(value: dict, tokens: list):
+        for key, item in value.items():
+            if item is None:
+                update.unset[update.path([*tokens, key])] = ""
+            elif isinstance(item, dict):
+                # An empty object merges as a no-op
+                walk(item, [*tokens, key])
+            else:
+                update.set[update.path([*tokens, key])] = item
+
+    if not isinstance(patch, dict):
+        raise HTTPException(status_code=400, detail="A merge-patch must be a JSON object")
+    walk(patch, [])
+    update.check_conflicts()
+    return update
+
+
+def is_array_index(token: str) -> bool:
+    return token.isdigit()
+
+
+def from_json_patch(operations: list, prefix: str = "content") -> ContentUpdate:
+    """Translate JSON Patch (RFC 6902) operations.
+
+    add/replace become $set (appending with "-" becomes $push), remove becomes
+    $unset and test becomes a filter condition. replace and remove also
+    require their target, and add its parent, to exist, so the update fails
+    rather than creating paths the RFC says must fail.
+
+    MongoDB cannot insert or delete an array element by position with
+    $set/$unset, so add and remove with an array index are rejected;
+    replace the whole array or append with "-" instead. Numeric keys are
+    treated as array indexes. move and copy need the current value and are
+    not supported.
+    """
+    update = ContentUpdate(prefix)
+    if not isinstance(operations, list):
+        raise HTTPException(status_code=400, detail="A JSON Patch must be an array of operations")
+    for operation in operations:
+        if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+            raise HTTPException(status_code=400, detail="Each JSON Patch operation needs 'op' and 'path'")
+        op = operation["op"]
+        tokens = parse_pointer(operation["path"])
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise HTTPException(status_code=400, detail=f"'{op}' operation needs a 'value'")
+        if op in ("add", "remove") and is_array_index(tokens[-1]):
+            raise HTTPException(
+                status_code=400,
+                detail=f"'{op}' by array index is not supported; replace the whole array or append with '-'"
+            )
+        if op == "add" and tokens[-1] == "-":
+            update.push[update.path(tokens[:-1])] = operation["value"]
+            update.require(tokens[:-1])
+        elif op == "add":
+            update.set[update.path(tokens)] = operation["value"]
+            update.require(tokens[:-1])
+        elif op == "replace":
+            update.set[update.path(tokens)] = operation["value"]
+            update.require(tokens)
+        elif op == "remove":
+            update.unset[update.path(tokens)] = ""
+            update.require(tokens)
+        elif op == "test":
+            # $eq, so an object value is matched literally rather than read as query operators
+            update.conditions[update.path(tokens)] = {"$eq": operation["value"]}
+        else:
+            raise HTTPException(status_code=400, detail=f"Unsupported JSON Patch operation: {op}")
+    update.check_conflicts()
+    return update
+
+
+def parse_patch(body, content_type: str = None, prefix: str = "content") -> ContentUpdate:
+    """Build a ContentUpdate from a PATCH body, choosing the format from its media type"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type == JSON_PATCH_TYPE or (media_type != MERGE_PATCH_TYPE and isinstance(body, list)):
+        return from_json_patch(body, prefix)
+    return from_merge_patch(body, prefix)
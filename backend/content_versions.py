@@ -0,0 +1,143 @@
+from pymongo import ReturnDocument, DESCENDING
+from datetime import datetime
+import os
+import logging
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+# Versions of change log kept; clients further behind get the full content
+SITE_CONTENT_LOG_LIMIT = int(os.environ.get('SITE_CONTENT_LOG_LIMIT', '500'))
+# Clients at most this many versions behind get a delta, each cached per version;
+# further behind share one cached full response, so ?since= cannot flood the cache
+SITE_CONTENT_DELTA_VERSIONS = int(os.environ.get('SITE_CONTENT_DELTA_VERSIONS', '32'))
+
+# Carries the current version on a 304 to ?since=, where there is no body to read it from
+SITE_CONTENT_VERSION_HEADER = "X-Content-Version"
+
+# Recorded in place of a path list when an edit replaced the whole content
+FULL_REPLACE = "*"
+
+
+async def update_site_content_versioned(update: dict, paths: list, username: str,
+                                        query: dict = None, upsert: bool = True):
+    """Apply an update to the site content document, bump its version and log the changed paths.
+
+    paths are dotted paths relative to content; [FULL_REPLACE] marks a whole
+    replacement. Returns the new version, or None when query matched nothing.
+    """
+    update = dict(update)
+    update["$set"] = {**update.get("$set", {}), "updated_at": datetime.utcnow(), "updated_by": username}
+    update["$inc"] = {"version": 1}
+    # The document before the update: None means no match, or with upsert a fresh insert
+    previous = await db.site_content.find_one_and_update(
+        query or {},
+        update,
+        projection={"_id": 0, "version": 1},
+        upsert=upsert,
+        return_document=ReturnDocument.BEFORE
+    )
+    if previous is None and not upsert:
+        return None
+
+    version = (previous or {}).get("version", 0) + 1
+    await db.site_content_changes.insert_one({
+        "version": version,
+        "paths": list(paths),
+        "updated_at": update["$set"]["updated_at"],
+        "updated_by": username
+    })
+    if version > SITE_CONTENT_LOG_LIMIT:
+        await db.site_content_changes.delete_many({"version": {"$lte": version - SITE_CONTENT_LOG_LIMIT}})
+    return version
+
+
+async def load_site_content_version() -> int:
+    document = await db.site_content.find_one({}, sort=[("updated_at", -1)], projection={"_id": 0, "version": 1})
+    return (document or {}).get("version", 0)
+
+
+def delta_path(content: dict, path: str) -> str:
+    """Cut a changed path at the first value a merge-patch can only replace whole.
+
+    Merge-patches merge objects only, so a change inside an array (e.g.
+    items.0) is sent as the whole current array, and a change below a value
+    that is now missing or not an object is sent at that value.
+    """
+    keys = path.split(".")
+    value = content
+    for depth, key in enumerate(keys, 1):
+        if not isinstance(value, dict) or key not in value:
+            return ".".join(keys[:depth])
+        value = value[key]
+        if not isinstance(value, dict):
+            return ".".join(keys[:depth])
+    return path
+
+
+def outermost(paths: set) -> list:
+    """Drop paths already covered by a changed ancestor"""
+    kept = []
+    for path in sorted(paths):
+        if not any(path.startswith(parent + ".") for parent in kept):
+            kept.append(path)
+    return kept
+
+
+def lookup(content: dict, path: str):
+    """Value at a dotted path, or None when it no longer exists"""
+    value = content
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def merge_patch(content: dict, paths: list) -> dict:
+    """JSON merge-patch carrying the current value of each changed path; null marks removal"""
+    patch = {}
+    for path in paths:
+        *parents, key = path.split(".")
+        target = patch
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = lookup(content, path)
+    return patch
+
+
+async def load_site_content_delta(since: int) -> dict:
+    """Changes to site content after version `since`, as a merge-patch against that version.
+
+    Falls back to the full content when the log no longer covers the range,
+    or when an edit in it replaced everything.
+    """
+    document = await db.site_content.find_one({}, sort=[("updated_at", -1)],
+                                              projection={"_id": 0, "content": 1, "version": 1})
+    document = document or {}
+    content = document.get("content", {})
+    version = document.get("version", 0)
+
+    changes = await db.site_content_changes.find(
+        {"version": {"$gt": since, "$lte": version}},
+        projection={"_id": 0, "version": 1, "paths": 1}
+    ).sort("version", DESCENDING).to_list(None)
+
+    # A gap means the log was pruned past `since`, or an edit is not logged yet
+    complete = since <= version and len(changes) == version - since
+    paths = set()
+    for change in changes:
+        paths.update(change["paths"])
+    if not complete or FULL_REPLACE in paths:
+        return {"version": version, "full": True, "content": content}
+    paths = outermost({delta_path(content, path) for path in paths})
+    return {"version": version, "full": False, "changes": merge_patch(content, paths)}
+
+
+async def load_site_content_full() -> dict:
+    """The whole site content in the ?since= response shape, for clients too far behind for a delta"""
+    document = await db.site_content.find_one({}, sort=[("updated_at", -1)],
+                                              projection={"_id": 0, "content": 1, "version": 1})
+    document = document or {}
+    return {"version": document.get("version", 0), "full": True, "content": document.get("content", {})}
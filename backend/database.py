@@ -1,10 +1,15 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
+import asyncio
 from datetime import datetime
 import os
+import time
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
 
+from mongo_monitor import command_monitor
+
 # Load environment variables
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -13,9 +18,151 @@ logger = logging.getLogger(__name__)
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Every command is timed per collection and attributed to the request that issued it
+client = AsyncIOMotorClient(mongo_url, event_listeners=[command_monitor])
 db = client[os.environ.get('DB_NAME', 'shield_foundation')]
 
+# Collection names are cached briefly; validating a name shouldn't cost a round trip
+COLLECTION_NAMES_TTL_SECONDS = 60
+_collection_names_cache = {"names": None, "loaded_at": 0.0}
+
+async def get_collection_names(refresh: bool = False):
+    """Return the database's collection names, cached for a short time"""
+    cache = _collection_names_cache
+    if refresh or cache["names"] is None or time.monotonic() - cache["loaded_at"] > COLLECTION_NAMES_TTL_SECONDS:
+        cache["names"] = await db.list_collection_names()
+        cache["loaded_at"] = time.monotonic()
+    return cache["names"]
+
+async def collection_exists(collection_name: str) -> bool:
+    """Check a collection name against the cached list, refreshing once on a miss"""
+    if collection_name in await get_collection_names():
+        return True
+    return collection_name in await get_collection_names(refresh=True)
+
+# Every index the routes rely on, per collection: (keys, options)
+# Filters and sorts in server.py should be covered by one of these
+# Newest-first order of the admin lists and the database browser's default created_at sort
+BROWSE_INDEX = ([("created_at", DESCENDING), ("_id", DESCENDING)], {})
+# Cache sync's polling fallback reads the latest updated_at of every CMS collection
+WATERMARK_INDEX = ([("updated_at", DESCENDING)], {})
+ORDERED_CMS_INDEXES = [
+    ([("id", ASCENDING)], {}),
+    ([("is_active", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)], {}),
+    BROWSE_INDEX,
+    WATERMARK_INDEX,
+]
+INDEX_MANIFEST = {
+    "admin_users": [
+        ([("username", ASCENDING)], {"unique": True}),
+    ],
+    "contacts": [
+        ([("id", ASCENDING)], {}),
+        ([("email", ASCENDING)], {}),
+        BROWSE_INDEX,
+    ],
+    "volunteers": [
+        ([("id", ASCENDING)], {}),
+        ([("email", ASCENDING)], {}),
+        BROWSE_INDEX,
+    ],
+    "newsletters": [
+        ([("email", ASCENDING)], {"unique": True}),
+        ([("is_active", ASCENDING), ("subscribed_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ],
+    "news": [
+        ([("id", ASCENDING)], {}),
+        BROWSE_INDEX,
+        ([("status", ASCENDING), ("created_at", DESCENDING)], {}),
+        WATERMARK_INDEX,
+    ],
+    "site_content": [
+        WATERMARK_INDEX,
+    ],
+    "site_content_changes": [
+        ([("version", ASCENDING)], {"unique": True}),
+    ],
+    "impact_stats": [
+        WATERMARK_INDEX,
+    ],
+    "revoked_tokens": [
+        ([("digest", ASCENDING)], {"unique": True, "sparse": True}),
+        ([("username", ASCENDING), ("issued_before", DESCENDING)], {}),
+        # Entries are dropped once the tokens they reject would have expired anyway
+        ([("exp", ASCENDING)], {"expireAfterSeconds": 0}),
+        WATERMARK_INDEX,
+    ],
+    "bulk_jobs": [
+        ([("id", ASCENDING)], {"unique": True}),
+        # Finished jobs are kept a week for progress lookups; running ones have no finished_at
+        ([("finished_at", ASCENDING)], {"expireAfterSeconds": 7 * 24 * 3600}),
+    ],
+    "success_stories": ORDERED_CMS_INDEXES,
+    "leadership_team": ORDERED_CMS_INDEXES,
+    "gallery_items": ORDERED_CMS_INDEXES,
+    "page_sections": [
+        ([("id", ASCENDING)], {}),
+        ([("page", ASCENDING), ("is_active", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)], {}),
+        BROWSE_INDEX,
+        WATERMARK_INDEX,
+    ],
+}
+
+def has_browse_index(collection_name: str) -> bool:
+    """Whether the database browser can page the collection by created_at from an index"""
+    return BROWSE_INDEX in INDEX_MANIFEST.get(collection_name, [])
+
+# Index options that must match for an existing index to count as the declared one
+COMPARED_INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+async def ensure_collection_indexes(collection_name: str, declared: list) -> dict:
+    """Create the declared indexes missing from a collection and report drift"""
+    existing = await db[collection_name].index_information()
+    # Servers may report directions as floats; text/hashed indexes use strings
+    existing_by_keys = {
+        tuple((k, d if isinstance(d, str) else int(d)) for k, d in info["key"]): (name, info)
+        for name, info in existing.items()
+    }
+
+    missing = []
+    mismatched = []
+    declared_keys = set()
+    for keys, options in declared:
+        key = tuple(keys)
+        declared_keys.add(key)
+        if key not in existing_by_keys:
+            missing.append(IndexModel(keys, **options))
+            continue
+        name, info = existing_by_keys[key]
+        if any(info.get(option) != options.get(option) for option in COMPARED_INDEX_OPTIONS):
+            mismatched.append(name)
+
+    if missing:
+        await db[collection_name].create_indexes(missing)
+
+    unmanaged = [name for key, (name, _) in existing_by_keys.items() if key not in declared_keys and name != "_id_"]
+    return {
+        "created": [model.document["name"] for model in missing],
+        "mismatched": mismatched,
+        "unmanaged": unmanaged,
+    }
+
+async def ensure_indexes() -> dict:
+    """Build missing manifest indexes on all collections concurrently; return a per-collection report"""
+    results = await asyncio.gather(*(
+        ensure_collection_indexes(name, declared) for name, declared in INDEX_MANIFEST.items()
+    ))
+    report = dict(zip(INDEX_MANIFEST, results))
+
+    for collection_name, result in report.items():
+        if result["created"]:
+            logger.info(f"Created indexes on {collection_name}: {', '.join(result['created'])}")
+        if result["mismatched"]:
+            logger.warning(f"Index options differ from manifest on {collection_name}: {', '.join(result['mismatched'])}")
+        if result["unmanaged"]:
+            logger.warning(f"Indexes not in manifest on {collection_name}: {', '.join(result['unmanaged'])}")
+    return report
+
 async def init_database():
     """Initialize database with default data"""
     try:
@@ -24,10 +171,10 @@ async def init_database():
         existing_admin = await admin_collection.find_one({"username": "admin"})
         
         if not existing_admin:
-            from auth import hash_password
+            from auth import hash_password_async
             admin_user = {
                 "username": "admin",
-                "password": hash_password("admin123"),
+                "password": await hash_password_async("admin123"),
                 "name": "Shield Admin",
                 "role": "super_admin",
                 "created_at": datetime.utcnow()
@@ -51,12 +198,7 @@ async def init_database():
             await stats_collection.insert_one(initial_stats)
             logger.info("Initial impact stats created")
             
-        # Create indexes for better performance
-        await db.contacts.create_index("email")
-        await db.volunteers.create_index("email")
-        await db.newsletters.create_index("email", unique=True)
-        await db.admin_users.create_index("username", unique=True)
-        await db.news.create_index([("created_at", -1)])
+        await ensure_indexes()
         
         logger.info("Database initialization completed")
         
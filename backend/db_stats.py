@@ -0,0 +1,68 @@
+from pymongo.errors import PyMongoError
+import asyncio
+import time
+import logging
+
+from database import db, get_collection_names
+
+logger = logging.getLogger(__name__)
+
+# Admin dashboards poll these; a few seconds of staleness is fine
+STATS_TTL_SECONDS = 30
+
+_stats_cache = {"stats": None, "loaded_at": 0.0, "lock": None}
+
+
+async def get_collection_stats(collection_name: str) -> dict:
+    """Read count and sizes for one collection from its storage metadata"""
+    try:
+        # Metadata lookup, no collection scan; sharded collections return one row per shard
+        rows = await db[collection_name].aggregate(
+            [{"$collStats": {"storageStats": {}}}]
+        ).to_list(length=None)
+        storage = [row.get("storageStats", {}) for row in rows]
+        return {
+            "collection": collection_name,
+            "count": sum(s.get("count", 0) for s in storage),
+            "size": sum(s.get("size", 0) for s in storage),
+            "storage_size": sum(s.get("storageSize", 0) for s in storage),
+            "index_size": sum(s.get("totalIndexSize", 0) for s in storage),
+        }
+    except (PyMongoError, NotImplementedError) as e:
+        # Views, some deployments and in-memory stand-ins such as mongomock don't support $collStats
+        logger.debug(f"$collStats unavailable for {collection_name}: {e}")
+        return {
+            "collection": collection_name,
+            "count": await db[collection_name].estimated_document_count(),
+            "size": 0,
+            "storage_size": 0,
+            "index_size": 0,
+        }
+
+
+async def load_database_stats(refresh: bool = False) -> list:
+    """Return per-collection stats for every collection, gathered concurrently.
+
+    Results are cached for STATS_TTL_SECONDS and shared by concurrent callers.
+    """
+    cache = _stats_cache
+    if not refresh and cache["stats"] is not None and time.monotonic() - cache["loaded_at"] <= STATS_TTL_SECONDS:
+        return cache["stats"]
+
+    if cache["lock"] is None:
+        cache["lock"] = asyncio.Lock()
+    async with cache["lock"]:
+        # Another caller may have refreshed the stats while we waited
+        if not refresh and cache["stats"] is not None and time.monotonic() - cache["loaded_at"] <= STATS_TTL_SECONDS:
+            return cache["stats"]
+
+        collections = await get_collection_names(refresh=True)
+        stats = await asyncio.gather(*(get_collection_stats(name) for name in collections))
+        cache["stats"] = list(stats)
+        cache["loaded_at"] = time.monotonic()
+        return cache["stats"]
+
+
+def invalidate_database_stats():
+    """Drop cached stats so the next request recomputes them"""
+    _stats_cache["stats"] = None
@@ -0,0 +1,228 @@
+from bson import json_util
+from pymongo.errors import BulkWriteError
+from pathlib import Path
+from contextlib import contextmanager
+import asyncio
+import fcntl
+import os
+import time
+import logging
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+# "direct" writes each submission before responding; "batched" queues it for the flusher
+FORM_INGEST_MODE = os.environ.get('FORM_INGEST_MODE', 'direct')
+FORM_BATCH_SIZE = int(os.environ.get('FORM_BATCH_SIZE', '100'))
+FORM_FLUSH_INTERVAL_SECONDS = float(os.environ.get('FORM_FLUSH_INTERVAL_SECONDS', '0.5'))
+FORM_QUEUE_MAX_SIZE = int(os.environ.get('FORM_QUEUE_MAX_SIZE', '10000'))
+# Submissions that could not be written are appended here and replayed on the next startup;
+# workers share it, coordinating through flock on FORM_SPOOL_PATH.lock
+FORM_SPOOL_PATH = Path(os.environ.get('FORM_SPOOL_PATH', ROOT_DIR / 'form_spool.jsonl'))
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class WriteBehindQueue:
+    """Queue of validated form documents written in batches by a background flusher.
+
+    A batch is flushed once it reaches batch_size documents or flush_interval
+    seconds after its first document, whichever comes first. Each flush
+    issues one unordered insert_many per collection.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_size: int, spool_path: Path):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.spool_path = spool_path
+        self.lock_path = spool_path.with_name(spool_path.name + ".lock")
+        self._queue = None
+        self._task = None
+        # Documents taken off the queue for the batch being collected
+        self._batch = []
+        self.flushed = 0
+        self.flushes = 0
+        self.spooled = 0
+        self.direct_writes = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Form write-behind queue started (batch {self.batch_size}, interval {self.flush_interval}s)")
+
+    async def stop(self):
+        """Stop the flusher and write out everything still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        remaining, self._batch = self._batch, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            await self.flush(remaining)
+
+    async def submit(self, collection_name: str, document: dict):
+        """Queue a document, writing it directly if the flusher isn't running or the queue is full"""
+        if self.running:
+            try:
+                self._queue.put_nowait((collection_name, document))
+                return
+            except asyncio.QueueFull:
+                pass
+        self.direct_writes += 1
+        await db[collection_name].insert_one(document)
+
+    async def _run(self):
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._batch = self._batch, []
+            try:
+                await self.flush(batch)
+            except asyncio.CancelledError:
+                # Shutting down mid-flush; don't lose the batch
+                self.spool(batch)
+                raise
+            except Exception as e:
+                # The flusher must outlive a bad batch, or every later submission is dropped with it
+                logger.error(f"Failed to flush {len(batch)} form submissions: {e}")
+                self.spool(batch)
+
+    async def flush(self, batch):
+        """Insert a batch with one unordered insert_many per collection"""
+        started = time.perf_counter()
+        by_collection = {}
+        for collection_name, document in batch:
+            by_collection.setdefault(collection_name, []).append(document)
+
+        for collection_name, documents in by_collection.items():
+            try:
+                await db[collection_name].insert_many(documents, ordered=False)
+                self.flushed += len(documents)
+            except BulkWriteError as e:
+                # Duplicate keys mean the document was already written (e.g. a replayed spool)
+                failed = [documents[err["index"]] for err in e.details.get("writeErrors", [])
+                          if err.get("code") != DUPLICATE_KEY_ERROR]
+                self.flushed += len(documents) - len(failed)
+                if failed:
+                    logger.error(f"Failed to write {len(failed)} {collection_name} documents: {e}")
+                    self.spool([(collection_name, document) for document in failed])
+            except Exception as e:
+                # Not only PyMongoError: bson raises InvalidDocument before anything is sent
+                logger.error(f"Failed to write {len(documents)} {collection_name} documents: {e}")
+                self.spool([(collection_name, document) for document in documents])
+
+        elapsed = time.perf_counter() - started
+        self.flushes += 1
+        self.flush_seconds_total += elapsed
+        self.flush_seconds_max = max(self.flush_seconds_max, elapsed)
+
+    @contextmanager
+    def spool_lock(self, operation: int):
+        """Hold a shared (append) or exclusive (claim for replay) lock on the spool"""
+        with open(self.lock_path, "a") as lock_file:
+            # Released when the file is closed
+            fcntl.flock(lock_file, operation)
+            yield
+
+    def spool(self, batch):
+        """Append unwritten documents to the spool file so they survive a restart"""
+        lines = []
+        for collection_name, document in batch:
+            try:
+                lines.append(json_util.dumps({"collection": collection_name, "document": document}) + "\n")
+            except (TypeError, ValueError) as e:
+                logger.error(f"Dropped a {collection_name} document that cannot be spooled: {e}")
+        if not lines:
+            return
+        try:
+            with self.spool_lock(fcntl.LOCK_SH), open(self.spool_path, "a", encoding="utf-8") as spool_file:
+                spool_file.writelines(lines)
+        except OSError as e:
+            logger.error(f"Failed to spool {len(lines)} form submissions, they are lost: {e}")
+            return
+        self.spooled += len(lines)
+        logger.warning(f"Spooled {len(lines)} form submissions to {self.spool_path}")
+
+    async def replay_spool(self):
+        """Write documents left in the spool by previous runs, whatever the ingest mode is now.
+
+        The spool is claimed by renaming it to a file of this worker's own
+        under the exclusive lock, so no append lands in a file being read.
+        Every *.replay file is then replayed, including ones left by a replay
+        that did not finish.
+        """
+        with self.spool_lock(fcntl.LOCK_EX):
+            if self.spool_path.exists():
+                self.spool_path.rename(self.spool_path.with_name(
+                    f"{self.spool_path.name}.{os.getpid()}-{time.time_ns()}.replay"
+                ))
+        for pending in sorted(self.spool_path.parent.glob(self.spool_path.name + "*.replay")):
+            await self.replay_file(pending)
+
+    async def replay_file(self, pending: Path):
+        """Replay one claimed spool file unless another worker is replaying or has replayed it"""
+        try:
+            replay_file = open(pending, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with replay_file:
+            try:
+                fcntl.flock(replay_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return
+            # Unlinked by a worker that finished it between our open and lock
+            if os.fstat(replay_file.fileno()).st_nlink == 0:
+                return
+            batch = []
+            for line in replay_file:
+                try:
+                    if line.strip():
+                        batch.append(json_util.loads(line))
+                except ValueError:
+                    # e.g. the last line of a spool cut short by a crash
+                    logger.error(f"Skipped an unreadable line in {pending.name}")
+            logger.info(f"Replaying {len(batch)} spooled form submissions from {pending.name}")
+            # Failures are spooled again by flush; documents already written are skipped as duplicates
+            await self.flush([(item["collection"], item["document"]) for item in batch])
+            pending.unlink()
+
+    def metrics(self) -> dict:
+        return {
+            "mode": FORM_INGEST_MODE,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "flushed": self.flushed,
+            "flushes": self.flushes,
+            "spooled": self.spooled,
+            "direct_writes": self.direct_writes,
+            "flush_seconds_total": self.flush_seconds_total,
+            "flush_seconds_max": self.flush_seconds_max,
+        }
+
+
+form_queue = WriteBehindQueue(
+    FORM_BATCH_SIZE, FORM_FLUSH_INTERVAL_SECONDS, FORM_QUEUE_MAX_SIZE, FORM_SPOOL_PATH
+)
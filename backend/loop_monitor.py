@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How often the loop is probed, and how long a stall must last before its stack is captured
+LOOP_LAG_INTERVAL_SECONDS = float(os.environ.get('LOOP_LAG_INTERVAL_SECONDS', '0.05'))
+LOOP_LAG_THRESHOLD_MS = float(os.environ.get('LOOP_LAG_THRESHOLD_MS', '100'))
+# Innermost frames logged per stall; the outer ones are always the ASGI middleware stack
+LOOP_STACK_DEPTH = 20
+
+
+class LoopLagMonitor:
+    """Measures event-loop scheduling lag and reports what blocked the loop.
+
+    A heartbeat task sleeps for `interval` and records how late it woke up.
+    A watchdog thread checks the heartbeat; when the loop has not run it for
+    longer than the threshold, it logs the loop thread's current stack,
+    which is the code holding the loop.
+    """
+
+    def __init__(self, interval: float, threshold_ms: float):
+        self.interval = interval
+        self.threshold = threshold_ms / 1000
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.lag_total = 0.0
+        self.samples = 0
+        self.stalls = 0
+        self._last_heartbeat = 0.0
+        self._stalled = False
+        self._task = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._loop_thread_id = None
+
+    def start(self):
+        self._loop_thread_id = threading.get_ident()
+        self._last_heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"Event loop lag monitor started (threshold {self.threshold * 1000:.0f}ms)")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _heartbeat(self):
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - started - self.interval)
+            self._last_heartbeat = now
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.lag_total += lag
+            self.samples += 1
+            if lag >= self.threshold:
+                self.stalls += 1
+                if self._stalled:
+                    logger.warning(f"Event loop unblocked after {lag * 1000:.0f}ms")
+            self._stalled = False
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            blocked = time.monotonic() - self._last_heartbeat - self.interval
+            if blocked < self.threshold or self._stalled:
+                continue
+            self._stalled = True
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=LOOP_STACK_DEPTH)) if frame is not None else "<unavailable>\n"
+            logger.warning(
+                f"Event loop blocked for {blocked * 1000:.0f}ms; stack of the blocking code:\n{stack.rstrip()}"
+            )
+
+    def collect_metrics(self):
+        """Samples for the metrics registry"""
+        return [
+            ("event_loop_lag_seconds", "gauge", "Scheduling lag of the latest heartbeat",
+             [({}, self.last_lag)]),
+            ("event_loop_lag_seconds_max", "gauge", "Largest scheduling lag seen",
+             [({}, self.max_lag)]),
+            ("event_loop_lag_seconds_total", "counter", "Sum of heartbeat scheduling lag",
+             [({}, self.lag_total)]),
+            ("event_loop_heartbeats_total", "counter", "Heartbeats measured",
+             [({}, self.samples)]),
+            ("event_loop_stalls_total", "counter", "Heartbeats delayed past the stall threshold",
+             [({}, self.stalls)]),
+        ]
+
+
+loop_monitor = LoopLagMonitor(LOOP_LAG_INTERVAL_SECONDS, LOOP_LAG_THRESHOLD_MS)
@@ -0,0 +1,160 @@
+from fastapi.responses import PlainTextResponse
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Request latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Requests that matched no route share one label so unknown paths can't add series
+UNMATCHED_ROUTE = "unmatched"
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+class RouteStats:
+    """Counters and a latency histogram for one (method, route template)"""
+
+    __slots__ = ("bucket_counts", "count", "errors", "duration_sum", "statuses")
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.errors = 0
+        self.duration_sum = 0.0
+        self.statuses = {}
+
+    def observe(self, status_code: int, duration: float):
+        self.count += 1
+        self.duration_sum += duration
+        self.statuses[status_code] = self.statuses.get(status_code, 0) + 1
+        if status_code >= 500:
+            self.errors += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+
+class MetricsRegistry:
+    """Per-route request metrics plus gauges contributed by other components.
+
+    Other modules add samples with register_collector(); a collector returns
+    a list of (name, type, help, [(labels, value), ...]) tuples when scraped.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.in_flight = {}
+        self._collectors = []
+
+    def observe_request(self, method: str, route: str, status_code: int, duration: float):
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.observe(status_code, duration)
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+
+        def family(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{format_labels(labels)} {value}")
+
+        routes = sorted(self.routes.items())
+        family("http_requests_total", "counter", "Requests handled, by route template and status code", [
+            ({"method": method, "route": route, "status": status_code}, count)
+            for (method, route), stats in routes
+            for status_code, count in sorted(stats.statuses.items())
+        ])
+        family("http_request_errors_total", "counter", "Requests that failed with a 5xx status", [
+            ({"method": method, "route": route}, stats.errors) for (method, route), stats in routes
+        ])
+
+        histogram = []
+        for (method, route), stats in routes:
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                cumulative += bucket_count
+                histogram.append(({"method": method, "route": route, "le": bound}, cumulative))
+            histogram.append(({"method": method, "route": route, "le": "+Inf"}, stats.count))
+        lines.append("# HELP http_request_duration_seconds Request latency by route template")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for labels, value in histogram:
+            lines.append(f"http_request_duration_seconds_bucket{format_labels(labels)} {value}")
+        for (method, route), stats in routes:
+            labels = format_labels({"method": method, "route": route})
+            lines.append(f"http_request_duration_seconds_sum{labels} {stats.duration_sum}")
+            lines.append(f"http_request_duration_seconds_count{labels} {stats.count}")
+
+        family("http_requests_in_flight", "gauge", "Requests currently being handled", [
+            ({"method": method}, count) for method, count in sorted(self.in_flight.items())
+        ])
+
+        for collector in self._collectors:
+            try:
+                for name, metric_type, help_text, samples in collector():
+                    family(name, metric_type, help_text, samples)
+            except Exception as e:
+                logger.error(f"Metrics collector {collector.__name__} failed: {e}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording count, errors and latency per route template.
+
+    The route template is read from the scope after routing, so
+    /api/page-sections/about is recorded as /api/page-sections/{page}.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = self.registry.in_flight
+        in_flight[method] = in_flight.get(method, 0) + 1
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight[method] -= 1
+            route = scope.get("route")
+            route_path = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            self.registry.observe_request(method, route_path, status_code, time.perf_counter() - started)
+
+
+def metrics_response() -> PlainTextResponse:
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
@@ -92,6 +92,10 @@ class AdminLogin(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=6)
 
+class PasswordChange(BaseModel):
+    current_password: str = Field(..., min_length=6)
+    new_password: str = Field(..., min_length=6)
+
 class AdminUser(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     username: str
@@ -121,6 +125,31 @@ class MessageResponse(BaseModel):
     message: str
     success: bool = True
 
+class OrderUpdate(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=5000)  # Item IDs in display order
+
+class OrderUpdateResponse(MessageResponse):
+    modified: int  # Items whose position changed
+
+# Bulk Operation Models
+CONTACT_STATUSES = ["new", "responded", "closed"]
+VOLUNTEER_STATUSES = ["pending", "approved", "rejected"]
+
+class BulkFilter(BaseModel):
+    status: Optional[str] = None
+    email: Optional[str] = None
+    inquiry_type: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+class BulkSelection(BaseModel):
+    # Exactly one of ids (our UUID id field) or filter
+    ids: Optional[List[str]] = Field(None, min_length=1, max_length=100000)
+    filter: Optional[BulkFilter] = None
+
+class BulkStatusUpdate(BulkSelection):
+    status: str
+
 class LoginResponse(BaseModel):
     message: str
     success: bool = True
@@ -0,0 +1,144 @@
+from pymongo import monitoring
+import os
+import threading
+import logging
+
+from request_context import request_context
+
+logger = logging.getLogger(__name__)
+
+# Commands slower than this are logged with their filter shape
+MONGO_SLOW_COMMAND_MS = float(os.environ.get('MONGO_SLOW_COMMAND_MS', '100'))
+
+# Where each command keeps the filter that decides which documents it touches
+FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+
+
+def shape(value):
+    """Replace the values in a filter with "?" and keep the field names and operators"""
+    if isinstance(value, dict):
+        return {key: shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # Keep the clauses of $or/$and, collapse lists of values to one placeholder
+        if value and all(isinstance(item, dict) for item in value):
+            return [shape(item) for item in value]
+        return "?"
+    return "?"
+
+
+def command_collection(command_name: str, command: dict) -> str:
+    if command_name == "getMore":
+        return command.get("collection", "")
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+def command_filter_shape(command_name: str, command: dict):
+    """Shape of the filter (and sort) a command runs, or None if it has no filter"""
+    if command_name in FILTER_FIELDS:
+        query = command.get(FILTER_FIELDS[command_name])
+    elif command_name == "aggregate":
+        pipeline = command.get("pipeline") or [{}]
+        query = pipeline[0].get("$match")
+    elif command_name in ("update", "delete"):
+        statements = command.get(command_name + "s") or [{}]
+        query = statements[0].get("q")
+    else:
+        return None
+    result = {"filter": shape(query or {})}
+    if command.get("sort"):
+        result["sort"] = dict(command["sort"])
+    return result
+
+
+class CommandStats:
+    __slots__ = ("count", "failures", "seconds_total", "seconds_max")
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.seconds_total = 0.0
+        self.seconds_max = 0.0
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """Time every MongoDB command by collection and command name.
+
+    Callbacks run on Motor's executor threads with the issuing request's
+    context, so each command can be attributed to its request ID.
+    """
+
+    def __init__(self, slow_ms: float):
+        self.slow_seconds = slow_ms / 1000
+        self.stats = {}
+        self._started = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        self._started[(event.connection_id, event.request_id)] = (
+            command_collection(event.command_name, event.command),
+            event.command,
+            request_context.get(),
+        )
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool):
+        started = self._started.pop((event.connection_id, event.request_id), None)
+        if started is None:
+            return
+        collection, command, context = started
+        seconds = event.duration_micros / 1_000_000
+
+        with self._lock:
+            stats = self.stats.get((collection, event.command_name))
+            if stats is None:
+                stats = self.stats[(collection, event.command_name)] = CommandStats()
+            stats.count += 1
+            stats.failures += failed
+            stats.seconds_total += seconds
+            stats.seconds_max = max(stats.seconds_max, seconds)
+            if context is not None:
+                context.command_count += 1
+                context.command_seconds += seconds
+
+        if seconds >= self.slow_seconds:
+            request_id = context.request_id if context is not None else "-"
+            logger.warning(
+                f"Slow MongoDB {event.command_name} on {collection or event.database_name}: "
+                f"{seconds * 1000:.1f}ms request={request_id} "
+                f"shape={command_filter_shape(event.command_name, command)}"
+            )
+
+    def collect_metrics(self):
+        """Samples for the metrics registry"""
+        with self._lock:
+            rows = [(key, stats.count, stats.failures, stats.seconds_total, stats.seconds_max)
+                    for key, stats in sorted(self.stats.items())]
+
+        def samples(index):
+            return [({"collection": collection, "command": name}, row[index])
+                    for (collection, name), *row in rows]
+
+        return [
+            ("mongodb_commands_total", "counter", "MongoDB commands completed, by collection and command",
+             samples(0)),
+            ("mongodb_command_failures_total", "counter", "MongoDB commands that returned an error",
+             samples(1)),
+            ("mongodb_command_seconds_total", "counter", "Time spent in MongoDB commands",
+             samples(2)),
+            ("mongodb_command_seconds_max", "gauge", "Slowest MongoDB command seen",
+             samples(3)),
+        ]
+
+
+command_monitor = CommandMonitor(MONGO_SLOW_COMMAND_MS)
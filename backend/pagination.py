@@ -0,0 +1,148 @@
+from fastapi import HTTPException
+from bson import json_util
+import base64
+import os
+
+# Page size used by admin list endpoints when the client doesn't pass one
+DEFAULT_PAGE_SIZE = int(os.environ.get('ADMIN_PAGE_SIZE', '50'))
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sort_value, doc_id) -> str:
+    """Encode a (sort value, _id) position of any BSON types as an opaque URL-safe cursor"""
+    raw = json_util.dumps([sort_value, doc_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, doc_id = json_util.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return sort_value, doc_id
+
+
+def keyset_query(query: dict, sort_field: str, cursor: str = None) -> dict:
+    """Restrict a query to documents after the cursor in (sort_field, _id) descending order.
+
+    _id breaks ties because every document has one, including legacy
+    documents created without our id field.
+    """
+    if not cursor:
+        return query
+    sort_value, doc_id = decode_cursor(cursor)
+    after_cursor = {"$or": [
+        {sort_field: {"$lt": sort_value}},
+        {sort_field: sort_value, "_id": {"$lt": doc_id}},
+    ]}
+    return {"$and": [query, after_cursor]} if query else after_cursor
+
+
+async def fetch_page(collection, query: dict, sort_field: str, limit: int, cursor: str = None,
+                     projection: dict = None):
+    """Fetch one page of documents newest first.
+
+    Returns (documents, next_cursor); next_cursor is None on the last page.
+    A projection must keep sort_field and _id for the cursor.
+    """
+    documents = await collection.find(
+        keyset_query(query, sort_field, cursor),
+        projection,
+        sort=[(sort_field, -1), ("_id", -1)],
+    ).limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        next_cursor = encode_cursor(last[sort_field], last["_id"])
+    return documents, next_cursor
+
+
+async def fetch_list(collection, query: dict, sort_field: str, response, limit: int,
+                     cursor: str = None, fetch_all: bool = False, projection: dict = None):
+    """Fetch documents for an admin list endpoint.
+
+    Pages by default and sets the X-Next-Cursor response header when more
+    documents remain; fetch_all returns the whole collection in one list.
+    """
+    if fetch_all:
+        return await collection.find(query, projection, sort=[(sort_field, -1), ("_id", -1)]).to_list(length=None)
+
+    documents, next_cursor = await fetch_page(collection, query, sort_field, limit, cursor, projection)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return documents
+
+
+def position_segments(sort_field: str, cursor: str, before: bool) -> list:
+    """Queries for the documents after (or before) a cursor, in page order.
+
+    The order is (sort_field, _id) descending, with documents missing
+    sort_field last. Each segment is a single index range, so a page reads
+    only the index entries it returns, however many documents lack the field.
+    """
+    sort_value, doc_id = decode_cursor(cursor)
+    id_op = "$gt" if before else "$lt"
+    if sort_field == "_id":
+        return [{"_id": {id_op: doc_id}}]
+
+    if sort_value is None:
+        if before:
+            return [{sort_field: None, "_id": {"$gt": doc_id}}, {sort_field: {"$ne": None}}]
+        return [{sort_field: None, "_id": {"$lt": doc_id}}]
+
+    value_op = "$gt" if before else "$lt"
+    segments = [
+        {sort_field: sort_value, "_id": {id_op: doc_id}},
+        {sort_field: {value_op: sort_value}},
+    ]
+    if not before:
+        segments.append({sort_field: None})
+    return segments
+
+
+async def browse_page(collection, sort_field: str, limit: int, after: str = None,
+                      before: str = None, skip: int = 0):
+    """Fetch one page of a collection for the database browser.
+
+    Pages forward from `after` or backward from `before`; with neither
+    cursor it falls back to `skip`. Returns (documents, next_cursor,
+    prev_cursor) with documents in descending (sort_field, _id) order.
+    Sorting by a field other than _id needs a (sort_field, _id) index.
+    """
+    sort = [(sort_field, -1)] if sort_field == "_id" else [(sort_field, -1), ("_id", -1)]
+    segments = [{}]
+    if before:
+        segments = position_segments(sort_field, before, before=True)
+        sort = [(field, -direction) for field, direction in sort]
+    elif after:
+        segments = position_segments(sort_field, after, before=False)
+
+    documents = []
+    for query in segments:
+        wanted = limit + 1 - len(documents)
+        cursor = collection.find(query, sort=sort)
+        if skip and not (after or before):
+            cursor = cursor.skip(skip)
+        documents += await cursor.limit(wanted).to_list(length=wanted)
+        if len(documents) > limit:
+            break
+
+    more = len(documents) > limit
+    documents = documents[:limit]
+    if before:
+        documents.reverse()
+    if not documents:
+        return documents, None, None
+
+    def position(doc):
+        return encode_cursor(doc.get(sort_field), doc["_id"])
+
+    has_next = more if not before else True
+    has_prev = more if before else bool(after or skip)
+    next_cursor = position(documents[-1]) if has_next else None
+    prev_cursor = position(documents[0]) if has_prev else None
+    return documents, next_cursor, prev_cursor
@@ -0,0 +1,102 @@
+from pathlib import Path
+import asyncio
+import os
+import sys
+import threading
+import logging
+
+from request_context import active_requests, route_label
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MAX_SECONDS = 300
+PROFILE_DEFAULT_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS', '10'))
+# Deeper stacks are truncated at the root end
+PROFILE_MAX_DEPTH = 128
+
+
+def frame_label(code) -> str:
+    # ';' separates frames in the collapsed format, so it can't appear in a label
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ":")
+
+
+def collapse(frame) -> list:
+    """Frame labels from the outermost call to `frame`"""
+    labels = []
+    while frame is not None and len(labels) < PROFILE_MAX_DEPTH:
+        labels.append(frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class SamplingProfiler:
+    """In-process sampling profiler for a live worker.
+
+    A background thread reads every thread's current frame with
+    sys._current_frames() at a fixed interval, so no ptrace or root access is
+    needed. Event-loop samples are rooted at the route of the request whose
+    task was running, which gives one flame graph per route.
+    """
+
+    def __init__(self):
+        self.running = False
+
+    async def profile(self, seconds: float, interval_ms: float, all_threads: bool = False) -> str:
+        """Sample for `seconds` and return the stacks in collapsed (folded) format"""
+        if self.running:
+            raise RuntimeError("A profile is already running")
+        self.running = True
+        loop = asyncio.get_running_loop()
+        stop = threading.Event()
+        counts = {}
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(loop, threading.get_ident(), interval_ms / 1000, all_threads, stop, counts),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        try:
+            sampler.start()
+            await asyncio.sleep(seconds)
+        finally:
+            stop.set()
+            # Joining takes at most one interval; don't block the loop for it
+            await loop.run_in_executor(None, sampler.join)
+            self.running = False
+
+        logger.info(f"Profiled {sum(counts.values())} samples over {seconds}s")
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
+
+    def _sample(self, loop, loop_thread_id, interval, all_threads, stop, counts):
+        own_thread_id = threading.get_ident()
+        thread_names = {}
+        while not stop.wait(interval):
+            frames = sys._current_frames()
+            for thread_id, frame in frames.items():
+                if thread_id == loop_thread_id:
+                    root = self._loop_root(loop)
+                elif all_threads and thread_id != own_thread_id:
+                    if thread_id not in thread_names:
+                        thread_names = {t.ident: t.name for t in threading.enumerate()}
+                    root = f"thread:{thread_names.get(thread_id, thread_id)}"
+                else:
+                    continue
+                stack = ";".join([root] + collapse(frame))
+                counts[stack] = counts.get(stack, 0) + 1
+            del frames
+
+    @staticmethod
+    def _loop_root(loop) -> str:
+        """Label for what the event loop is running right now"""
+        task = asyncio.current_task(loop)
+        if task is None:
+            return "(event loop)"
+        context = active_requests.get(task)
+        if context is not None:
+            return route_label(context)
+        # Tasks started by handlers (gather, background work) are labelled by coroutine
+        return f"task:{getattr(task.get_coro(), '__qualname__', task.get_name())}"
+
+
+profiler = SamplingProfiler()
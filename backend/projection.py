@@ -0,0 +1,42 @@
+from fastapi import HTTPException
+from typing import Optional
+
+
+def parse_fields(fields: Optional[str], allowed: tuple) -> tuple:
+    """Validate a comma-separated ?fields= value against the fields an endpoint returns.
+
+    Returns the requested fields in request order, or all allowed fields
+    when none were requested.
+    """
+    if not fields:
+        return allowed
+    requested = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in allowed]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return requested
+
+
+def projection_for(fields: tuple, sources: dict = None, always: tuple = ()) -> dict:
+    """MongoDB projection reading only what the output fields need.
+
+    sources maps an output field to the document fields it is built from
+    when they differ; always lists fields needed regardless (e.g. for
+    pagination cursors). _id is excluded unless a source or always asks for it.
+    """
+    sources = sources or {}
+    include = dict.fromkeys(always)
+    for name in fields:
+        include.update(dict.fromkeys(sources.get(name, (name,))))
+    projection = {name: 1 for name in include}
+    if "_id" not in projection:
+        projection["_id"] = 0
+    return projection
+
+
+def pick(row: dict, fields: tuple) -> dict:
+    """Keep only the requested output fields of a row, in request order"""
+    return {name: row[name] for name in fields}
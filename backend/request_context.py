@@ -0,0 +1,90 @@
+from contextvars import ContextVar
+import asyncio
+import os
+import re
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Warn when one request issues more MongoDB commands than this (usually a query in a loop)
+REQUEST_COMMAND_WARN_COUNT = int(os.environ.get('REQUEST_COMMAND_WARN_COUNT', '25'))
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Incoming IDs are reused only if they look like IDs, so they are safe to log
+VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestContext:
+    """Per-request state shared with code running on Motor's executor threads"""
+
+    __slots__ = ("request_id", "scope", "command_count", "command_seconds")
+
+    def __init__(self, request_id: str, scope: dict):
+        self.request_id = request_id
+        # The routed scope; scope["route"] is filled in once the router matches
+        self.scope = scope
+        self.command_count = 0
+        self.command_seconds = 0.0
+
+
+request_context: ContextVar = ContextVar("request_context", default=None)
+
+# Requests in flight by the task serving them, for tools that inspect the loop from another thread
+active_requests = {}
+
+
+def current_request_id():
+    context = request_context.get()
+    return context.request_id if context is not None else None
+
+
+def route_label(context: RequestContext) -> str:
+    """METHOD and route template of a request, once it has been routed"""
+    route = getattr(context.scope.get("route"), "path_format", None)
+    return f"{context.scope['method']} {route or context.scope['path']}"
+
+
+class RequestIdMiddleware:
+    """ASGI middleware giving each request an ID, echoed in the X-Request-ID header.
+
+    The context is visible to pymongo command listeners because Motor copies
+    the calling context onto its executor threads.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                incoming = value.decode("latin-1")
+                break
+        request_id = incoming if incoming and VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        context = RequestContext(request_id, scope)
+        token = request_context.set(context)
+        task = asyncio.current_task()
+        active_requests[task] = context
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (REQUEST_ID_HEADER.lower().encode("latin-1"), request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_context.reset(token)
+            active_requests.pop(task, None)
+            if context.command_count > REQUEST_COMMAND_WARN_COUNT:
+                logger.warning(
+                    f"Request {request_id} ({route_label(context)}) issued {context.command_count} "
+                    f"MongoDB commands taking {context.command_seconds * 1000:.1f}ms"
+                )
@@ -0,0 +1,70 @@
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from bson import ObjectId
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+import json
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # orjson is in requirements.txt; fall back to the stdlib encoder
+    orjson = None
+
+# "orjson" (default when installed) or "stdlib"; both encode datetime and ObjectId directly
+JSON_SERIALIZER = os.environ.get('JSON_SERIALIZER', 'orjson' if orjson else 'stdlib')
+
+
+def encode_value(value):
+    """Encode the types MongoDB documents and handlers hand us that JSON lacks"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_stdlib(content) -> bytes:
+    # Same settings as Starlette's JSONResponse
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":"), default=encode_value).encode("utf-8")
+
+
+def dumps_orjson(content) -> bytes:
+    # orjson writes datetimes in the same form as isoformat()
+    return orjson.dumps(content, default=encode_value, option=orjson.OPT_NON_STR_KEYS)
+
+
+if JSON_SERIALIZER == "orjson" and orjson is None:
+    logger.warning("JSON_SERIALIZER=orjson but orjson is not installed; using the stdlib encoder")
+    JSON_SERIALIZER = "stdlib"
+
+dumps = dumps_orjson if JSON_SERIALIZER == "orjson" else dumps_stdlib
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with the configured serializer"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def json_response(payload, response: Response = None, status_code: int = 200) -> FastJSONResponse:
+    """Render a payload directly, skipping FastAPI's jsonable_encoder pass.
+
+    Headers set on the endpoint's injected `response` are carried over.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(payload, status_code=status_code, headers=headers)
@@ -1,6 +1,9 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from datetime import datetime
 import os
 import logging
@@ -10,16 +13,36 @@ import asyncio
 # Import custom modules
 from models import *
 from auth import *
-from database import db, init_database
+from database import db, init_database, collection_exists, has_browse_index
+from cache import response_cache, cached_response, cached_bundle, entry_headers
+from cache_sync import run_cache_sync
+from ingest import form_queue, FORM_INGEST_MODE
+from db_stats import load_database_stats, invalidate_database_stats
+from pagination import fetch_list, browse_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from metrics import MetricsMiddleware, metrics_registry, metrics_response
+from mongo_monitor import command_monitor
+from request_context import RequestIdMiddleware
+from loop_monitor import loop_monitor
+from profiler import profiler, PROFILE_MAX_SECONDS, PROFILE_DEFAULT_INTERVAL_MS
+from serialization import FastJSONResponse, json_response
+from projection import parse_fields, projection_for, pick
+from compression import CompressionMiddleware
+from content_patch import parse_patch
+from bulk_ops import bulk_operations, filter_query
+from content_versions import update_site_content_versioned, FULL_REPLACE, SITE_CONTENT_VERSION_HEADER
+from content_versions import load_site_content_version, load_site_content_delta, load_site_content_full, SITE_CONTENT_DELTA_VERSIONS
 
 ROOT_DIR = Path(__file__).parent
 
 # Create the main app
-app = FastAPI(title="Shield Foundation API", version="1.0.0")
+app = FastAPI(title="Shield Foundation API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Innermost, so precompressed cache entries are recognised and passed through
+app.add_middleware(CompressionMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -27,8 +50,15 @@ app.add_middleware(
     allow_origins=["https://menindata.org"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Request-ID", SITE_CONTENT_VERSION_HEADER],
 )
 
+# Tags each request with an ID that MongoDB command logs refer to
+app.add_middleware(RequestIdMiddleware)
+
+# Outermost, so latency includes CORS handling and unmatched paths are counted
+app.add_middleware(MetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,7 +69,14 @@ logger = logging.getLogger(__name__)
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
+    loop_monitor.start()
     await init_database()
+    # Evict this worker's cached responses when another worker writes CMS data
+    app.state.cache_sync_task = asyncio.create_task(run_cache_sync(db))
+    # Submissions spooled by an earlier run are written even if batching has since been turned off
+    await form_queue.replay_spool()
+    if FORM_INGEST_MODE == "batched":
+        await form_queue.start()
 
 # Health check endpoint
 @api_router.get("/")
@@ -53,7 +90,7 @@ async def submit_contact_form(contact_data: ContactCreate):
     """Submit a contact form"""
     try:
         contact = Contact(**contact_data.dict())
-        await db.contacts.insert_one(contact.dict())
+        await form_queue.submit("contacts", contact.dict())
         logger.info(f"New contact form submitted: {contact.email}")
         return MessageResponse(message="Thank you for your message. We will get back to you soon!")
     except Exception as e:
@@ -65,77 +102,110 @@ async def submit_volunteer_form(volunteer_data: VolunteerCreate):
     """Submit a volunteer application"""
     try:
         volunteer = Volunteer(**volunteer_data.dict())
-        await db.volunteers.insert_one(volunteer.dict())
+        await form_queue.submit("volunteers", volunteer.dict())
         logger.info(f"New volunteer application: {volunteer.email}")
         return MessageResponse(message="Thank you for registering as a volunteer!")
     except Exception as e:
         logger.error(f"Volunteer application failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to submit volunteer application")
 
+async def subscribe_to_newsletter(collection, email: str) -> str:
+    """Subscribe an email in one atomic upsert.
+
+    Returns "subscribed" for a new subscriber, "already_subscribed" if the
+    email is active, or "reactivated" if it had been unsubscribed.
+    """
+    newsletter = Newsletter(email=email)
+    # Pipeline update so subscribed_at only moves when the subscription (re)starts
+    update = [{"$set": {
+        "id": {"$ifNull": ["$id", newsletter.id]},
+        "subscribed_at": {"$cond": [{"$eq": ["$is_active", True]}, "$subscribed_at", newsletter.subscribed_at]},
+        "is_active": True,
+    }}]
+    for attempt in range(2):
+        try:
+            previous = await collection.find_one_and_update(
+                {"email": email}, update, upsert=True,
+                projection={"_id": 0, "is_active": 1}, return_document=ReturnDocument.BEFORE
+            )
+            break
+        except DuplicateKeyError:
+            # A concurrent signup inserted the email first; the retry matches its document
+            if attempt:
+                raise
+
+    if previous is None:
+        return "subscribed"
+    if previous.get("is_active"):
+        return "already_subscribed"
+    return "reactivated"
+
 @api_router.post("/newsletter/subscribe", response_model=MessageResponse)
 async def subscribe_newsletter(newsletter_data: NewsletterSubscribe):
     """Subscribe to newsletter"""
     try:
-        # Check if email already exists
-        existing = await db.newsletters.find_one({"email": newsletter_data.email})
-        if existing:
-            if existing.get("is_active"):
-                return MessageResponse(message="You are already subscribed to our newsletter!")
-            else:
-                # Reactivate subscription
-                await db.newsletters.update_one(
-                    {"email": newsletter_data.email},
-                    {"$set": {"is_active": True, "subscribed_at": datetime.utcnow()}}
-                )
-                return MessageResponse(message="Welcome back! Your newsletter subscription has been reactivated.")
-        
-        newsletter = Newsletter(**newsletter_data.dict())
-        await db.newsletters.insert_one(newsletter.dict())
-        logger.info(f"New newsletter subscription: {newsletter.email}")
+        outcome = await subscribe_to_newsletter(db.newsletters, newsletter_data.email)
+        if outcome == "already_subscribed":
+            return MessageResponse(message="You are already subscribed to our newsletter!")
+        if outcome == "reactivated":
+            return MessageResponse(message="Welcome back! Your newsletter subscription has been reactivated.")
+        
+        logger.info(f"New newsletter subscription: {newsletter_data.email}")
         return MessageResponse(message="Successfully subscribed to newsletter!")
     except Exception as e:
         logger.error(f"Newsletter subscription failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to subscribe to newsletter")
 
+async def load_published_news():
+    """Load published news articles, newest first"""
+    news_cursor = db.news.find(
+        {"status": "published"},
+        {"id": 1, "title": 1, "content": 1, "author": 1, "created_at": 1, "status": 1}
+    ).sort("created_at", -1)
+    news_list = []
+    async for news_item in news_cursor:
+        news_list.append({
+            "id": news_item.get("id", str(news_item["_id"])),
+            "title": news_item["title"],
+            "content": news_item["content"],
+            "author": news_item["author"],
+            "date": news_item["created_at"].isoformat() if news_item.get("created_at") else None,
+            "status": news_item["status"]
+        })
+    return news_list
+
 @api_router.get("/news")
-async def get_published_news():
+async def get_published_news(request: Request):
     """Get all published news articles"""
     try:
-        news_cursor = db.news.find({"status": "published"}).sort("created_at", -1)
-        news_list = []
-        async for news_item in news_cursor:
-            news_list.append({
-                "id": news_item.get("id", str(news_item["_id"])),
-                "title": news_item["title"],
-                "content": news_item["content"],
-                "author": news_item["author"],
-                "date": news_item["created_at"].isoformat() if news_item.get("created_at") else None,
-                "status": news_item["status"]
-            })
-        return news_list
+        return await cached_response("news", None, load_published_news, request)
     except Exception as e:
         logger.error(f"Failed to fetch news: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch news")
 
+async def load_impact_stats():
+    """Load the current impact statistics"""
+    stats = await db.impact_stats.find_one({}, sort=[("updated_at", -1)])
+    if not stats:
+        # Return default stats if none exist
+        return {
+            "youthTrained": 1300,
+            "youthPlaced": 1000, 
+            "seniorsSupported": 6000,
+            "womenEmpowered": 200
+        }
+    return {
+        "youthTrained": stats.get("youth_trained", 1300),
+        "youthPlaced": stats.get("youth_placed", 1000),
+        "seniorsSupported": stats.get("seniors_supported", 6000),
+        "womenEmpowered": stats.get("women_empowered", 200)
+    }
+
 @api_router.get("/impact-stats")
-async def get_impact_stats():
+async def get_impact_stats(request: Request):
     """Get current impact statistics"""
     try:
-        stats = await db.impact_stats.find_one({}, sort=[("updated_at", -1)])
-        if not stats:
-            # Return default stats if none exist
-            return {
-                "youthTrained": 1300,
-                "youthPlaced": 1000, 
-                "seniorsSupported": 6000,
-                "womenEmpowered": 200
-            }
-        return {
-            "youthTrained": stats.get("youth_trained", 1300),
-            "youthPlaced": stats.get("youth_placed", 1000),
-            "seniorsSupported": stats.get("seniors_supported", 6000),
-            "womenEmpowered": stats.get("women_empowered", 200)
-        }
+        return await cached_response("impact_stats", None, load_impact_stats, request)
     except Exception as e:
         logger.error(f"Failed to fetch impact stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch impact statistics")
@@ -147,7 +217,7 @@ async def admin_login(login_data: AdminLogin):
     """Admin login"""
     try:
         admin_user = await db.admin_users.find_one({"username": login_data.username})
-        if not admin_user or not verify_password(login_data.password, admin_user["password"]):
+        if not admin_user or not await verify_password_async(login_data.password, admin_user["password"]):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
@@ -185,67 +255,159 @@ async def admin_login(login_data: AdminLogin):
         logger.error(f"Admin login failed: {e}")
         raise HTTPException(status_code=500, detail="Login failed")
 
+@api_router.post("/admin/logout", response_model=MessageResponse)
+async def admin_logout(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Admin logout; the token is rejected from now on, on every worker"""
+    try:
+        await revoke_token(credentials.credentials)
+        return MessageResponse(message="Logged out successfully")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Admin logout failed: {e}")
+        raise HTTPException(status_code=500, detail="Logout failed")
+
+@api_router.post("/admin/change-password", response_model=MessageResponse)
+async def change_admin_password(password_data: PasswordChange, current_user: dict = Depends(admin_required)):
+    """Change the current admin's password and end all of their sessions"""
+    try:
+        admin_user = await db.admin_users.find_one({"username": current_user["username"]})
+        if not admin_user or not await verify_password_async(password_data.current_password, admin_user["password"]):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid credentials"
+            )
+
+        hashed = await hash_password_async(password_data.new_password)
+        await db.admin_users.update_one(
+            {"username": current_user["username"]},
+            {"$set": {"password": hashed, "password_changed_at": datetime.utcnow()}}
+        )
+        # Tokens issued with the old password, including this one, stop working
+        await revoke_user_tokens(current_user["username"])
+
+        logger.info(f"Password changed by {current_user['username']}")
+        return MessageResponse(message="Password changed; please log in again")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to change password: {e}")
+        raise HTTPException(status_code=500, detail="Failed to change password")
+
+# Admin list fields; ?fields= selects a subset and only those are read from MongoDB
+CONTACT_FIELDS = ("id", "name", "email", "phone", "subject", "message", "inquiry_type", "created_at", "status")
+VOLUNTEER_FIELDS = ("id", "name", "email", "phone", "skills", "availability", "interests", "experience",
+                    "created_at", "status")
+NEWSLETTER_FIELDS = ("id", "email", "subscribed_at", "is_active")
+ADMIN_NEWS_FIELDS = ("id", "title", "content", "status", "author", "date", "updated_at")
+
+# Output fields built from differently named document fields; id falls back to _id
+ID_SOURCES = {"id": ("id", "_id")}
+ADMIN_NEWS_SOURCES = {**ID_SOURCES, "date": ("created_at",), "updated_at": ("updated_at", "created_at")}
+
+def document_id(document: dict) -> str:
+    return document["id"] if "id" in document else str(document.get("_id"))
+
 @api_router.get("/admin/contacts")
-async def get_contacts(current_user: dict = Depends(admin_required)):
-    """Get all contact form submissions"""
+async def get_contacts(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fetch_all: bool = Query(False, alias="all"),
+    fields: Optional[str] = None,
+    current_user: dict = Depends(admin_required)
+):
+    """Get contact form submissions, newest first, one page per cursor"""
     try:
-        contacts_cursor = db.contacts.find({}).sort("created_at", -1)
+        selected = parse_fields(fields, CONTACT_FIELDS)
+        contacts = await fetch_list(
+            db.contacts, {}, "created_at", response, limit, cursor, fetch_all,
+            projection_for(selected, ID_SOURCES, always=("created_at", "_id"))
+        )
         contacts_list = []
-        async for contact in contacts_cursor:
-            contacts_list.append({
-                "id": contact.get("id", str(contact["_id"])),
-                "name": contact["name"],
-                "email": contact["email"],
+        for contact in contacts:
+            contacts_list.append(pick({
+                "id": document_id(contact),
+                "name": contact.get("name"),
+                "email": contact.get("email"),
                 "phone": contact.get("phone"),
-                "subject": contact["subject"],
-                "message": contact["message"],
+                "subject": contact.get("subject"),
+                "message": contact.get("message"),
                 "inquiry_type": contact.get("inquiry_type"),
-                "created_at": contact["created_at"].isoformat(),
+                "created_at": contact["created_at"],
                 "status": contact.get("status", "new")
-            })
-        return contacts_list
+            }, selected))
+        return json_response(contacts_list, response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch contacts: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch contacts")
 
 @api_router.get("/admin/volunteers")
-async def get_volunteers(current_user: dict = Depends(admin_required)):
-    """Get all volunteer applications"""
+async def get_volunteers(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fetch_all: bool = Query(False, alias="all"),
+    fields: Optional[str] = None,
+    current_user: dict = Depends(admin_required)
+):
+    """Get volunteer applications, newest first, one page per cursor"""
     try:
-        volunteers_cursor = db.volunteers.find({}).sort("created_at", -1)
+        selected = parse_fields(fields, VOLUNTEER_FIELDS)
+        volunteers = await fetch_list(
+            db.volunteers, {}, "created_at", response, limit, cursor, fetch_all,
+            projection_for(selected, ID_SOURCES, always=("created_at", "_id"))
+        )
         volunteers_list = []
-        async for volunteer in volunteers_cursor:
-            volunteers_list.append({
-                "id": volunteer.get("id", str(volunteer["_id"])),
-                "name": volunteer["name"],
-                "email": volunteer["email"],
-                "phone": volunteer["phone"],
+        for volunteer in volunteers:
+            volunteers_list.append(pick({
+                "id": document_id(volunteer),
+                "name": volunteer.get("name"),
+                "email": volunteer.get("email"),
+                "phone": volunteer.get("phone"),
                 "skills": volunteer.get("skills"),
-                "availability": volunteer["availability"],
-                "interests": volunteer["interests"],
+                "availability": volunteer.get("availability"),
+                "interests": volunteer.get("interests"),
                 "experience": volunteer.get("experience"),
-                "created_at": volunteer["created_at"].isoformat(),
+                "created_at": volunteer["created_at"],
                 "status": volunteer.get("status", "pending")
-            })
-        return volunteers_list
+            }, selected))
+        return json_response(volunteers_list, response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch volunteers: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch volunteers")
 
 @api_router.get("/admin/newsletters")
-async def get_newsletter_subscribers(current_user: dict = Depends(admin_required)):
-    """Get all newsletter subscribers"""
+async def get_newsletter_subscribers(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fetch_all: bool = Query(False, alias="all"),
+    fields: Optional[str] = None,
+    current_user: dict = Depends(admin_required)
+):
+    """Get active newsletter subscribers, newest first, one page per cursor"""
     try:
-        newsletters_cursor = db.newsletters.find({"is_active": True}).sort("subscribed_at", -1)
+        selected = parse_fields(fields, NEWSLETTER_FIELDS)
+        newsletters = await fetch_list(
+            db.newsletters, {"is_active": True}, "subscribed_at", response, limit, cursor, fetch_all,
+            projection_for(selected, ID_SOURCES, always=("subscribed_at", "_id"))
+        )
         newsletters_list = []
-        async for newsletter in newsletters_cursor:
-            newsletters_list.append({
-                "id": newsletter.get("id", str(newsletter["_id"])),
-                "email": newsletter["email"],
-                "subscribed_at": newsletter["subscribed_at"].isoformat(),
-                "is_active": newsletter["is_active"]
-            })
-        return newsletters_list
+        for newsletter in newsletters:
+            newsletters_list.append(pick({
+                "id": document_id(newsletter),
+                "email": newsletter.get("email"),
+                "subscribed_at": newsletter["subscribed_at"],
+                "is_active": newsletter.get("is_active")
+            }, selected))
+        return json_response(newsletters_list, response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch newsletter subscribers: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch newsletter subscribers")
@@ -256,6 +418,7 @@ async def create_news(news_data: NewsCreate, current_user: dict = Depends(admin_
     try:
         news = News(**news_data.dict(), author=current_user["username"])
         await db.news.insert_one(news.dict())
+        response_cache.invalidate("news")
         logger.info(f"News article created: {news.title}")
         return MessageResponse(message="News article created successfully!")
     except Exception as e:
@@ -277,6 +440,7 @@ async def update_news(news_id: str, news_data: NewsUpdate, current_user: dict =
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="News article not found")
             
+        response_cache.invalidate("news")
         logger.info(f"News article updated: {news_id}")
         return MessageResponse(message="News article updated successfully!")
     except HTTPException:
@@ -293,6 +457,7 @@ async def delete_news(news_id: str, current_user: dict = Depends(admin_required)
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="News article not found")
             
+        response_cache.invalidate("news")
         logger.info(f"News article deleted: {news_id}")
         return MessageResponse(message="News article deleted successfully!")
     except HTTPException:
@@ -302,22 +467,35 @@ async def delete_news(news_id: str, current_user: dict = Depends(admin_required)
         raise HTTPException(status_code=500, detail="Failed to delete news article")
 
 @api_router.get("/admin/news")
-async def get_all_news(current_user: dict = Depends(admin_required)):
-    """Get all news articles (including drafts)"""
+async def get_all_news(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fetch_all: bool = Query(False, alias="all"),
+    fields: Optional[str] = None,
+    current_user: dict = Depends(admin_required)
+):
+    """Get news articles (including drafts), newest first, one page per cursor"""
     try:
-        news_cursor = db.news.find({}).sort("created_at", -1)
+        selected = parse_fields(fields, ADMIN_NEWS_FIELDS)
+        news_items = await fetch_list(
+            db.news, {}, "created_at", response, limit, cursor, fetch_all,
+            projection_for(selected, ADMIN_NEWS_SOURCES, always=("created_at", "_id"))
+        )
         news_list = []
-        async for news_item in news_cursor:
-            news_list.append({
-                "id": news_item.get("id", str(news_item["_id"])),
-                "title": news_item["title"],
-                "content": news_item["content"],
-                "status": news_item["status"],
-                "author": news_item["author"],
-                "date": news_item["created_at"].isoformat(),
-                "updated_at": news_item.get("updated_at", news_item["created_at"]).isoformat()
-            })
-        return news_list
+        for news_item in news_items:
+            news_list.append(pick({
+                "id": document_id(news_item),
+                "title": news_item.get("title"),
+                "content": news_item.get("content"),
+                "status": news_item.get("status"),
+                "author": news_item.get("author"),
+                "date": news_item["created_at"],
+                "updated_at": news_item.get("updated_at", news_item["created_at"])
+            }, selected))
+        return json_response(news_list, response)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch all news: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch news")
@@ -337,6 +515,7 @@ async def update_impact_stats(stats_data: ImpactStatsUpdate, current_user: dict
             upsert=True
         )
         
+        response_cache.invalidate("impact_stats")
         logger.info(f"Impact stats updated by {current_user['username']}")
         return MessageResponse(message="Impact statistics updated successfully!")
     except Exception as e:
@@ -350,8 +529,8 @@ async def get_site_content(current_user: dict = Depends(admin_required)):
         content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
         if not content:
             # Return default content structure if none exists
-            return {"content": {}}
-        return {"content": content.get("content", {})}
+            return {"content": {}, "version": 0}
+        return {"content": content.get("content", {}), "version": content.get("version", 0)}
     except Exception as e:
         logger.error(f"Failed to fetch site content: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch site content")
@@ -360,19 +539,14 @@ async def get_site_content(current_user: dict = Depends(admin_required)):
 async def update_site_content(content_data: SiteContentUpdate, current_user: dict = Depends(admin_required)):
     """Update site content"""
     try:
-        update_data = {
-            "content": content_data.content,
-            "updated_at": datetime.utcnow(),
-            "updated_by": current_user["username"]
-        }
-        
         # Upsert - update if exists, create if doesn't
-        await db.site_content.update_one(
-            {},
-            {"$set": update_data},
-            upsert=True
+        await update_site_content_versioned(
+            {"$set": {"content": content_data.content}},
+            [FULL_REPLACE],
+            current_user["username"]
         )
         
+        response_cache.invalidate("site_content")
         logger.info(f"Site content updated by {current_user['username']}")
         return MessageResponse(message="Site content updated successfully!")
     except Exception as e:
@@ -383,74 +557,124 @@ async def update_site_content(content_data: SiteContentUpdate, current_user: dic
 async def update_contact_info(contact_data: ContactInfoUpdate, current_user: dict = Depends(admin_required)):
     """Update contact information"""
     try:
-        # Get current site content
-        current_content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
-        if not current_content:
-            current_content = {"content": {}}
-        
-        # Update contact info in the content structure
-        content = current_content.get("content", {})
-        if "contact" not in content:
-            content["contact"] = {}
-        if "contactInfo" not in content["contact"]:
-            content["contact"]["contactInfo"] = {}
-        
-        # Update only provided fields
-        contact_info = content["contact"]["contactInfo"]
-        if contact_data.email is not None:
-            contact_info["email"] = contact_data.email
-        if contact_data.phone is not None:
-            contact_info["phone"] = contact_data.phone
-        if contact_data.address is not None:
-            contact_info["address"] = contact_data.address
-        
-        # Save updated content
+        # Set only the provided fields in place, leaving the rest of the content untouched
         update_data = {
-            "content": content,
-            "updated_at": datetime.utcnow(),
-            "updated_by": current_user["username"]
+            f"content.contact.contactInfo.{field}": value
+            for field, value in contact_data.model_dump(exclude_none=True).items()
         }
+        if not update_data:
+            return MessageResponse(message="Contact information unchanged")
         
-        await db.site_content.update_one(
-            {},
+        await update_site_content_versioned(
             {"$set": update_data},
-            upsert=True
+            [path.removeprefix("content.") for path in update_data],
+            current_user["username"]
         )
         
+        response_cache.invalidate("site_content")
         logger.info(f"Contact info updated by {current_user['username']}")
         return MessageResponse(message="Contact information updated successfully!")
     except Exception as e:
         logger.error(f"Failed to update contact info: {e}")
         raise HTTPException(status_code=500, detail="Failed to update contact information")
 
+@api_router.patch("/admin/site-content", response_model=MessageResponse)
+async def patch_site_content(request: Request, current_user: dict = Depends(admin_required)):
+    """Apply a JSON Patch or merge-patch to site content as targeted $set/$unset operations"""
+    try:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Patch body must be valid JSON")
+        update = parse_patch(body, request.headers.get("content-type"))
+        if not update.paths:
+            return MessageResponse(message="Site content unchanged")
+
+        # Tests and required paths guard the write; an upsert would insert past a failed one
+        version = await update_site_content_versioned(
+            update.document(),
+            [path.removeprefix("content.") for path in update.paths],
+            current_user["username"],
+            query=update.conditions,
+            upsert=not update.conditions
+        )
+        if version is None:
+            raise HTTPException(status_code=409, detail="Patch precondition failed: a test did not match or a target path does not exist")
+        
+        response_cache.invalidate("site_content")
+        logger.info(f"Site content patched by {current_user['username']} to version {version}: {', '.join(update.paths)}")
+        return MessageResponse(message="Site content updated successfully!")
+    except HTTPException:
+        raise
+    except OperationFailure as e:
+        # e.g. setting a field inside a value that is not an object
+        raise HTTPException(status_code=409, detail=f"Patch conflicts with current content: {e}")
+    except Exception as e:
+        logger.error(f"Failed to patch site content: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update site content")
+
+async def load_site_content():
+    """Load the latest site content document"""
+    content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
+    if not content:
+        # Return empty content structure if none exists
+        return {"content": {}, "version": 0}
+    return {"content": content.get("content", {}), "version": content.get("version", 0)}
+
 @api_router.get("/site-content")
-async def get_public_site_content():
-    """Get current site content for public pages (no authentication required)"""
+async def get_public_site_content(request: Request, since: Optional[int] = Query(None, ge=0)):
+    """Get current site content for public pages (no authentication required).
+
+    With ?since=<version>, returns only what changed after that version as a
+    merge-patch, or 304 with the current version when nothing did. Clients
+    more than SITE_CONTENT_DELTA_VERSIONS behind, or ahead of this worker,
+    get the full content instead.
+    """
     try:
-        content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
-        if not content:
-            # Return empty content structure if none exists
-            return {"content": {}}
-        return {"content": content.get("content", {})}
+        if since is None:
+            return await cached_response("site_content", None, load_site_content, request)
+
+        version_entry = await response_cache.fetch("site_content", "version", load_site_content_version)
+        version = int(version_entry.body)
+        if since == version:
+            return Response(status_code=304, headers={
+                **entry_headers(version_entry), SITE_CONTENT_VERSION_HEADER: str(version)
+            })
+        # Ahead of us means this worker hasn't seen the latest edit yet; resync the client like a stale one
+        if since > version or version - since > SITE_CONTENT_DELTA_VERSIONS:
+            return await cached_response("site_content", ("since", "full"), load_site_content_full, request)
+        return await cached_response("site_content", ("since", since), lambda: load_site_content_delta(since), request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch public site content: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch site content")
 
+# Fields the public CMS endpoints return; ?fields= selects a subset
+SUCCESS_STORY_FIELDS = ("id", "name", "story", "image", "achievement", "location", "program")
+TEAM_MEMBER_FIELDS = ("id", "name", "role", "image", "description")
+PAGE_SECTION_FIELDS = ("id", "page", "section", "title", "content")
+GALLERY_ITEM_FIELDS = ("id", "title", "description", "image", "category", "date", "type")
+
 # Success Stories Endpoints
+async def load_success_stories(fields: tuple = SUCCESS_STORY_FIELDS):
+    """Load active success stories in display order"""
+    stories = await db.success_stories.find(
+        {"is_active": True},
+        projection_for(fields),
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    return {"stories": stories}
+
 @api_router.get("/success-stories")
-async def get_success_stories():
+async def get_success_stories(request: Request, fields: Optional[str] = None):
     """Get all active success stories (no authentication required)"""
     try:
-        stories = await db.success_stories.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for story in stories:
-            story["_id"] = str(story["_id"])
-            
-        return {"stories": stories}
+        selected = parse_fields(fields, SUCCESS_STORY_FIELDS)
+        key = None if selected == SUCCESS_STORY_FIELDS else selected
+        return await cached_response("success_stories", key, lambda: load_success_stories(selected), request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch success stories: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch success stories")
@@ -481,6 +705,7 @@ async def create_success_story(story_data: SuccessStoryCreate, current_user: dic
         
         result = await db.success_stories.insert_one(story_dict)
         
+        response_cache.invalidate("success_stories")
         logger.info(f"Success story created by {current_user['username']}: {story_dict['name']}")
         return MessageResponse(message="Success story created successfully!")
     except Exception as e:
@@ -502,6 +727,7 @@ async def update_success_story(story_id: str, story_data: SuccessStoryUpdate, cu
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Success story not found")
         
+        response_cache.invalidate("success_stories")
         logger.info(f"Success story updated by {current_user['username']}: {story_id}")
         return MessageResponse(message="Success story updated successfully!")
     except HTTPException:
@@ -519,6 +745,7 @@ async def delete_success_story(story_id: str, current_user: dict = Depends(admin
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Success story not found")
         
+        response_cache.invalidate("success_stories")
         logger.info(f"Success story deleted by {current_user['username']}: {story_id}")
         return MessageResponse(message="Success story deleted successfully!")
     except HTTPException:
@@ -528,20 +755,24 @@ async def delete_success_story(story_id: str, current_user: dict = Depends(admin
         raise HTTPException(status_code=500, detail="Failed to delete success story")
 
 # Leadership Team Endpoints
+async def load_leadership_team(fields: tuple = TEAM_MEMBER_FIELDS):
+    """Load active leadership team members in display order"""
+    members = await db.leadership_team.find(
+        {"is_active": True},
+        projection_for(fields),
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    return {"members": members}
+
 @api_router.get("/leadership-team")
-async def get_leadership_team():
+async def get_leadership_team(request: Request, fields: Optional[str] = None):
     """Get all active leadership team members (no authentication required)"""
     try:
-        members = await db.leadership_team.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for member in members:
-            member["_id"] = str(member["_id"])
-            
-        return {"members": members}
+        selected = parse_fields(fields, TEAM_MEMBER_FIELDS)
+        key = None if selected == TEAM_MEMBER_FIELDS else selected
+        return await cached_response("leadership_team", key, lambda: load_leadership_team(selected), request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch leadership team: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch leadership team")
@@ -572,6 +803,7 @@ async def create_team_member(member_data: TeamMemberCreate, current_user: dict =
         
         result = await db.leadership_team.insert_one(member_dict)
         
+        response_cache.invalidate("leadership_team")
         logger.info(f"Team member created by {current_user['username']}: {member_dict['name']}")
         return MessageResponse(message="Team member created successfully!")
     except Exception as e:
@@ -593,6 +825,7 @@ async def update_team_member(member_id: str, member_data: TeamMemberUpdate, curr
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Team member not found")
         
+        response_cache.invalidate("leadership_team")
         logger.info(f"Team member updated by {current_user['username']}: {member_id}")
         return MessageResponse(message="Team member updated successfully!")
     except HTTPException:
@@ -610,6 +843,7 @@ async def delete_team_member(member_id: str, current_user: dict = Depends(admin_
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Team member not found")
         
+        response_cache.invalidate("leadership_team")
         logger.info(f"Team member deleted by {current_user['username']}: {member_id}")
         return MessageResponse(message="Team member deleted successfully!")
     except HTTPException:
@@ -619,20 +853,25 @@ async def delete_team_member(member_id: str, current_user: dict = Depends(admin_
         raise HTTPException(status_code=500, detail="Failed to delete team member")
 
 # Page Sections Endpoints
+async def load_page_sections(page: str, fields: tuple = PAGE_SECTION_FIELDS):
+    """Load active sections for a page in display order"""
+    sections = await db.page_sections.find(
+        {"page": page, "is_active": True},
+        projection_for(fields),
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    return {"sections": sections}
+
 @api_router.get("/page-sections/{page}")
-async def get_page_sections(page: str):
+async def get_page_sections(page: str, request: Request, fields: Optional[str] = None):
     """Get all active sections for a specific page (no authentication required)"""
     try:
-        sections = await db.page_sections.find(
-            {"page": page, "is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for section in sections:
-            section["_id"] = str(section["_id"])
-            
-        return {"sections": sections}
+        selected = parse_fields(fields, PAGE_SECTION_FIELDS)
+        # The full-field entry is shared with /bundle/{page}
+        key = page if selected == PAGE_SECTION_FIELDS else (page, selected)
+        return await cached_response("page_sections", key, lambda: load_page_sections(page, selected), request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch page sections for {page}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch page sections")
@@ -666,6 +905,7 @@ async def create_page_section(section_data: PageSectionCreate, current_user: dic
         
         result = await db.page_sections.insert_one(section_dict)
         
+        response_cache.invalidate("page_sections")
         logger.info(f"Page section created by {current_user['username']}: {section_dict['page']}/{section_dict['section']}")
         return MessageResponse(message="Page section created successfully!")
     except Exception as e:
@@ -687,6 +927,7 @@ async def update_page_section(section_id: str, section_data: PageSectionUpdate,
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        response_cache.invalidate("page_sections")
         logger.info(f"Page section updated by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section updated successfully!")
     except HTTPException:
@@ -704,6 +945,7 @@ async def delete_page_section(section_id: str, current_user: dict = Depends(admi
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        response_cache.invalidate("page_sections")
         logger.info(f"Page section deleted by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section deleted successfully!")
     except HTTPException:
@@ -713,20 +955,24 @@ async def delete_page_section(section_id: str, current_user: dict = Depends(admi
         raise HTTPException(status_code=500, detail="Failed to delete page section")
 
 # Gallery Items Endpoints
+async def load_gallery_items(fields: tuple = GALLERY_ITEM_FIELDS):
+    """Load active gallery items in display order"""
+    items = await db.gallery_items.find(
+        {"is_active": True},
+        projection_for(fields),
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    return {"items": items}
+
 @api_router.get("/gallery-items")
-async def get_gallery_items():
+async def get_gallery_items(request: Request, fields: Optional[str] = None):
     """Get all active gallery items (no authentication required)"""
     try:
-        items = await db.gallery_items.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for item in items:
-            item["_id"] = str(item["_id"])
-            
-        return {"items": items}
+        selected = parse_fields(fields, GALLERY_ITEM_FIELDS)
+        key = None if selected == GALLERY_ITEM_FIELDS else selected
+        return await cached_response("gallery_items", key, lambda: load_gallery_items(selected), request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch gallery items: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch gallery items")
@@ -757,6 +1003,7 @@ async def create_gallery_item(item_data: GalleryItemCreate, current_user: dict =
         
         result = await db.gallery_items.insert_one(item_dict)
         
+        response_cache.invalidate("gallery_items")
         logger.info(f"Gallery item created by {current_user['username']}: {item_dict['title']}")
         return MessageResponse(message="Gallery item created successfully!")
     except Exception as e:
@@ -778,6 +1025,7 @@ async def update_gallery_item(item_id: str, item_data: GalleryItemUpdate, curren
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Gallery item not found")
         
+        response_cache.invalidate("gallery_items")
         logger.info(f"Gallery item updated by {current_user['username']}: {item_id}")
         return MessageResponse(message="Gallery item updated successfully!")
     except HTTPException:
@@ -795,6 +1043,7 @@ async def delete_gallery_item(item_id: str, current_user: dict = Depends(admin_r
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Gallery item not found")
         
+        response_cache.invalidate("gallery_items")
         logger.info(f"Gallery item deleted by {current_user['username']}: {item_id}")
         return MessageResponse(message="Gallery item deleted successfully!")
     except HTTPException:
@@ -803,33 +1052,164 @@ async def delete_gallery_item(item_id: str, current_user: dict = Depends(admin_r
         logger.error(f"Failed to delete gallery item: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete gallery item")
 
+# Bulk Contact and Volunteer Endpoints
+# Admin URL segment -> (collection, statuses its documents move through)
+BULK_COLLECTIONS = {
+    "contacts": ("contacts", CONTACT_STATUSES),
+    "volunteers": ("volunteers", VOLUNTEER_STATUSES),
+}
+
+def bulk_target(collection_path: str, selection: BulkSelection):
+    """Resolve the collection and the ids or query a bulk request selects"""
+    if collection_path not in BULK_COLLECTIONS:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    if (selection.ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or filter")
+    query = None
+    if selection.filter is not None:
+        query = filter_query(selection.filter.model_dump())
+        if not query:
+            # An empty filter would select the whole collection
+            raise HTTPException(status_code=400, detail="Filter must set at least one criterion")
+    return BULK_COLLECTIONS[collection_path], selection.ids, query
+
+def bulk_job_response(job) -> Response:
+    """Finished jobs return 200; jobs still running return 202 with where to follow their progress"""
+    if job.state == "running":
+        return FastJSONResponse(job.to_dict(), status_code=202, headers={"Location": f"/api/admin/bulk-jobs/{job.id}"})
+    return json_response(job.to_dict())
+
+@api_router.post("/admin/{collection_path}/bulk-status")
+async def bulk_update_status(collection_path: str, update_data: BulkStatusUpdate, current_user: dict = Depends(admin_required)):
+    """Set the status of many contacts or volunteers, selected by ID list or filter"""
+    try:
+        (collection_name, statuses), ids, query = bulk_target(collection_path, update_data)
+        if update_data.status not in statuses:
+            raise HTTPException(status_code=400, detail=f"Status must be one of: {', '.join(statuses)}")
+        
+        job = await bulk_operations.run(
+            collection_name, "status", current_user["username"], ids=ids, query=query,
+            update={"$set": {"status": update_data.status, "updated_at": datetime.utcnow()}}
+        )
+        return bulk_job_response(job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk update {collection_path} status: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update status")
+
+@api_router.post("/admin/{collection_path}/bulk-delete")
+async def bulk_delete(collection_path: str, selection: BulkSelection, current_user: dict = Depends(admin_required)):
+    """Delete many contacts or volunteers, selected by ID list or filter"""
+    try:
+        (collection_name, _), ids, query = bulk_target(collection_path, selection)
+        job = await bulk_operations.run(collection_name, "delete", current_user["username"], ids=ids, query=query,
+                                        on_finish=invalidate_database_stats)
+        return bulk_job_response(job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to bulk delete {collection_path}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to delete documents")
+
+@api_router.get("/admin/bulk-jobs/{job_id}")
+async def get_bulk_job(job_id: str, current_user: dict = Depends(admin_required)):
+    """Progress of a bulk operation, whichever worker runs it"""
+    job = await bulk_operations.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Bulk job not found")
+    return json_response(job.to_dict())
+
+# Bulk Reorder Endpoint
+# Admin URL segment -> collection whose items are displayed by their "order" field
+ORDERED_COLLECTIONS = {
+    "success-stories": "success_stories",
+    "leadership-team": "leadership_team",
+    "page-sections": "page_sections",
+    "gallery-items": "gallery_items",
+}
+
+@api_router.patch("/admin/{collection_path}/order", response_model=OrderUpdateResponse)
+async def reorder_collection(collection_path: str, order_data: OrderUpdate, current_user: dict = Depends(admin_required)):
+    """Set the display order of a CMS collection from an ordered list of item IDs in one bulk write"""
+    try:
+        collection_name = ORDERED_COLLECTIONS.get(collection_path)
+        if collection_name is None:
+            raise HTTPException(status_code=404, detail="Collection not found")
+        if len(set(order_data.ids)) != len(order_data.ids):
+            raise HTTPException(status_code=400, detail="Item IDs must be unique")
+        
+        updated_at = datetime.utcnow()
+        # Only items that moved are written, so updated_at (the cache sync watermark) moves with them.
+        # Unordered: the updates are independent, so the server may apply them in parallel
+        result = await db[collection_name].bulk_write([
+            UpdateOne({"id": item_id, "order": {"$ne": position}}, {"$set": {"order": position, "updated_at": updated_at}})
+            for position, item_id in enumerate(order_data.ids)
+        ], ordered=False)
+        
+        response_cache.invalidate(collection_name)
+        logger.info(f"{collection_name} reordered by {current_user['username']}: {result.modified_count} of {len(order_data.ids)} items moved")
+        return OrderUpdateResponse(
+            message="Order updated successfully!",
+            modified=result.modified_count
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to reorder {collection_path}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update order")
+
+# Page Bundle Endpoint
+# Public collections each frontend page renders, served together by /bundle/{page}
+PAGE_BUNDLES = {
+    "home": ["site_content", "impact_stats", "success_stories"],
+    "about": ["site_content", "leadership_team", "page_sections"],
+    "programs": ["site_content", "page_sections"],
+    "impact": ["site_content", "impact_stats", "page_sections"],
+    "gallery": ["site_content", "gallery_items", "page_sections"],
+    "blog": ["site_content", "news"],
+    "contact": ["site_content"],
+}
+
+@api_router.get("/bundle/{page}")
+async def get_page_bundle(page: str, request: Request):
+    """Get everything a public page renders in a single response (no authentication required)"""
+    if page not in PAGE_BUNDLES:
+        raise HTTPException(status_code=404, detail="Page not found")
+
+    # (cache key, loader) per collection; each part is the matching endpoint's payload
+    sources = {
+        "site_content": (None, load_site_content),
+        "impact_stats": (None, load_impact_stats),
+        "success_stories": (None, load_success_stories),
+        "leadership_team": (None, load_leadership_team),
+        "page_sections": (page, lambda: load_page_sections(page)),
+        "gallery_items": (None, load_gallery_items),
+        "news": (None, load_published_news),
+    }
+    try:
+        parts = [(collection, *sources[collection]) for collection in PAGE_BUNDLES[page]]
+        return await cached_bundle(parts, request)
+    except Exception as e:
+        logger.error(f"Failed to fetch page bundle for {page}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch page bundle")
+
 # DATABASE MANAGEMENT ENDPOINTS
 @api_router.get("/admin/database/stats")
-async def get_database_stats(current_user: dict = Depends(admin_required)):
+async def get_database_stats(refresh: bool = False, current_user: dict = Depends(admin_required)):
     """Get overall database statistics"""
     try:
-        collections = await db.list_collection_names()
-        
-        total_documents = 0
-        collection_stats = []
-        
-        for collection_name in collections:
-            count = await db[collection_name].count_documents({})
-            total_documents += count
-            
-            collection_stats.append({
-                "collection": collection_name,
-                "count": count,
-                "size": 0  # Size calculation disabled for compatibility
-            })
+        collection_stats = list(await load_database_stats(refresh))
         
         # Sort by document count descending
         collection_stats.sort(key=lambda x: x["count"], reverse=True)
         
         logger.info(f"Database stats retrieved by {current_user['username']}")
         return {
-            "total_collections": len(collections),
-            "total_documents": total_documents,
+            "total_collections": len(collection_stats),
+            "total_documents": sum(stats["count"] for stats in collection_stats),
+            "total_size": sum(stats["size"] for stats in collection_stats),
+            "total_storage_size": sum(stats["storage_size"] for stats in collection_stats),
             "collection_stats": collection_stats
         }
     except Exception as e:
@@ -837,11 +1217,9 @@ async def get_database_stats(current_user: dict = Depends(admin_required)):
         raise HTTPException(status_code=500, detail="Failed to retrieve database statistics")
 
 @api_router.get("/admin/database/collections")
-async def get_database_collections(current_user: dict = Depends(admin_required)):
+async def get_database_collections(refresh: bool = False, current_user: dict = Depends(admin_required)):
     """Get all database collections and their document counts"""
     try:
-        collections = await db.list_collection_names()
-        
         # Define collection display names and descriptions
         collection_info = {
             "admin_users": {"name": "Admin Users", "description": "System administrators and users"},
@@ -851,6 +1229,9 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
             "news": {"name": "News & Blog Posts", "description": "News articles and blog posts"},
             "impact_stats": {"name": "Impact Statistics", "description": "Foundation impact metrics and statistics"},
             "site_content": {"name": "Site Content", "description": "CMS content for website pages"},
+            "site_content_changes": {"name": "Site Content Changes", "description": "Paths changed by each site content version"},
+            "revoked_tokens": {"name": "Revoked Tokens", "description": "Logged-out tokens and per-user token cutoffs"},
+            "bulk_jobs": {"name": "Bulk Jobs", "description": "Progress of bulk status updates and deletes"},
             "success_stories": {"name": "Success Stories", "description": "Success story carousel items"},
             "leadership_team": {"name": "Leadership Team", "description": "Team member profiles"},
             "page_sections": {"name": "Page Sections", "description": "Configurable page sections"},
@@ -858,8 +1239,8 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
         }
         
         result = []
-        for collection_name in collections:
-            count = await db[collection_name].count_documents({})
+        for stats in await load_database_stats(refresh):
+            collection_name = stats["collection"]
             info = collection_info.get(collection_name, {
                 "name": collection_name.replace("_", " ").title(),
                 "description": f"Collection: {collection_name}"
@@ -869,7 +1250,9 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
                 "collection": collection_name,
                 "name": info["name"],
                 "description": info["description"],
-                "count": count
+                "count": stats["count"],
+                "size": stats["size"],
+                "storage_size": stats["storage_size"]
             })
         
         # Sort by collection name for consistency
@@ -882,42 +1265,55 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
         raise HTTPException(status_code=500, detail="Failed to retrieve database collections")
 
 @api_router.get("/admin/database/{collection_name}")
-async def get_collection_data(collection_name: str, limit: int = 100, skip: int = 0, current_user: dict = Depends(admin_required)):
-    """Get data from a specific collection"""
+async def get_collection_data(
+    collection_name: str,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0),
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    sort: str = Query("created_at", pattern="^(created_at|_id)$"),
+    exact_count: bool = False,
+    current_user: dict = Depends(admin_required)
+):
+    """Get data from a specific collection.
+
+    Page with the returned next_cursor / prev_cursor via ?after= / ?before=;
+    skip is still accepted but gets slower on deep pages. Collections without
+    a (created_at, _id) index are sorted by _id; the response reports the sort used.
+    """
     try:
         # Validate collection exists
-        collections = await db.list_collection_names()
-        if collection_name not in collections:
+        if not await collection_exists(collection_name):
             raise HTTPException(status_code=404, detail="Collection not found")
         
-        # Get collection data with pagination
-        cursor = db[collection_name].find({}).skip(skip).limit(limit)
-        
-        # Sort by created_at if available, otherwise by _id
-        try:
-            cursor = cursor.sort("created_at", -1)
-        except:
-            cursor = cursor.sort("_id", -1)
-        
-        documents = await cursor.to_list(length=limit)
+        # Without the (created_at, _id) index every page would sort the whole collection
+        if sort == "created_at" and not has_browse_index(collection_name):
+            sort = "_id"
         
-        # Convert ObjectIds to strings for JSON serialization
-        for doc in documents:
-            if "_id" in doc:
-                doc["_id"] = str(doc["_id"])
+        documents, next_cursor, prev_cursor = await browse_page(
+            db[collection_name], sort, limit, after=after, before=before, skip=skip
+        )
         
-        # Get total count for pagination
-        total_count = await db[collection_name].count_documents({})
+        # Collection metadata count is O(1); an exact count scans the collection
+        if exact_count:
+            total_count = await db[collection_name].count_documents({})
+        else:
+            total_count = await db[collection_name].estimated_document_count()
         
         logger.info(f"Collection {collection_name} data retrieved by {current_user['username']}")
-        return {
+        # Rendered directly: documents may hold ObjectIds and other BSON values at any depth
+        return json_response({
             "collection": collection_name,
             "documents": documents,
             "total_count": total_count,
+            "count_is_estimate": not exact_count,
             "limit": limit,
             "skip": skip,
-            "has_more": (skip + limit) < total_count
-        }
+            "sort": sort,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -929,8 +1325,7 @@ async def delete_document(collection_name: str, document_id: str, current_user:
     """Delete a document from a collection"""
     try:
         # Validate collection exists
-        collections = await db.list_collection_names()
-        if collection_name not in collections:
+        if not await collection_exists(collection_name):
             raise HTTPException(status_code=404, detail="Collection not found")
         
         # Prevent deletion of admin users (safety measure)
@@ -951,6 +1346,8 @@ async def delete_document(collection_name: str, document_id: str, current_user:
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Document not found")
         
+        response_cache.invalidate(collection_name)
+        invalidate_database_stats()
         logger.info(f"Document {document_id} deleted from {collection_name} by {current_user['username']}")
         return MessageResponse(message="Document deleted successfully!")
     except HTTPException:
@@ -959,9 +1356,67 @@ async def delete_document(collection_name: str, document_id: str, current_user:
         logger.error(f"Failed to delete document {document_id} from {collection_name}: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete document")
 
+# METRICS ENDPOINT
+def collect_component_metrics():
+    """Gauges and counters from the response cache, password pool and form queue"""
+    pool = password_hash_pool.metrics()
+    queue = form_queue.metrics()
+    return [
+        ("response_cache_hits_total", "counter", "Public responses served from the cache",
+         [({}, response_cache.hits)]),
+        ("response_cache_misses_total", "counter", "Public responses loaded from MongoDB",
+         [({}, response_cache.misses)]),
+        ("password_hash_active", "gauge", "bcrypt jobs running on the hash pool",
+         [({}, pool["active"])]),
+        ("password_hash_queued", "gauge", "bcrypt jobs waiting for a hash pool worker",
+         [({}, pool["queued"])]),
+        ("password_hash_rejected_total", "counter", "bcrypt jobs rejected because the pool was full",
+         [({}, pool["rejected"])]),
+        ("form_queue_depth", "gauge", "Form submissions waiting to be flushed",
+         [({}, queue["queue_depth"])]),
+        ("form_queue_flushed_total", "counter", "Form submissions written by the batch flusher",
+         [({}, queue["flushed"])]),
+        ("form_queue_spooled_total", "counter", "Form submissions spooled to disk after a failed write",
+         [({}, queue["spooled"])]),
+    ]
+
+metrics_registry.register_collector(collect_component_metrics)
+metrics_registry.register_collector(command_monitor.collect_metrics)
+metrics_registry.register_collector(loop_monitor.collect_metrics)
+
+@api_router.get("/metrics", include_in_schema=False)
+async def get_metrics(current_user: dict = Depends(metrics_required)):
+    """Prometheus metrics for this worker"""
+    return metrics_response()
+
+@api_router.post("/admin/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(30, gt=0, le=PROFILE_MAX_SECONDS),
+    interval_ms: float = Query(PROFILE_DEFAULT_INTERVAL_MS, ge=1, le=1000),
+    all_threads: bool = False,
+    current_user: dict = Depends(admin_required)
+):
+    """Sample this worker's stacks and return them in collapsed format for flame graph tools"""
+    if profiler.running:
+        raise HTTPException(status_code=409, detail="A profile is already running on this worker")
+    try:
+        logger.info(f"Profiling worker for {seconds}s requested by {current_user['username']}")
+        folded = await profiler.profile(seconds, interval_ms, all_threads)
+        filename = f"profile-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.folded"
+        return PlainTextResponse(folded, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+    except Exception as e:
+        logger.error(f"Profiling failed: {e}")
+        raise HTTPException(status_code=500, detail="Failed to profile worker")
+
 
 app.include_router(api_router)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    pass
+    cache_sync_task = getattr(app.state, "cache_sync_task", None)
+    if cache_sync_task:
+        cache_sync_task.cancel()
+    # Write out queued form submissions before the worker exits
+    await form_queue.stop()
+    await bulk_operations.stop()
+    await loop_monitor.stop()
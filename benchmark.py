@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+API Benchmark Suite for Shield Foundation
+Starts the FastAPI app in-process against a local mongod (or an in-memory
+stand-in), seeds synthetic data and drives every public and admin route
+with concurrent clients. Reports p50/p95/p99 latency, requests per second
+and memory per route, and saves the results as a JSON baseline. Data is
+seeded with synthetic_data.py. Any route answering with an error status
+fails the run.
+
+Client and app share one process and event loop, so the numbers are for
+comparing runs on the same machine rather than absolute capacity. The
+in-memory stand-in (mongomock-motor) has no $collStats, so the database
+stats routes report estimated counts without sizes there.
+
+Examples:
+    python benchmark.py --scale 1k --backend memory
+    python benchmark.py --scale 100k --output baseline.json
+    python benchmark.py --scale 100k --baseline baseline.json
+"""
+
+import asyncio
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from synthetic_data import SCALES, DatasetSpec, load_dataset, insert_batches
+
+SEED_BATCH_SIZE = 2000
+# Routes excluded on purpose: logout revokes the benchmark's token and profile runs for seconds
+EXCLUDED_ROUTES = ["POST /api/admin/logout", "POST /api/admin/profile"]
+
+
+def rss_mb() -> float:
+    """Current resident set size of this process"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def disposable_document(kind: str, i: int) -> dict:
+    """A document for update and delete routes to consume"""
+    if kind == "contacts":
+        from models import Contact
+        return Contact(name=f"Disposable {i}", email=f"disposable{i}@example.com", phone=None,
+                       subject="Disposable inquiry", message="Created for the delete benchmark.",
+                       inquiry_type="general").dict()
+    base = {"id": str(uuid.uuid4()), "order": i, "is_active": True,
+            "created_at": datetime.utcnow(), "updated_at": datetime.utcnow()}
+    if kind == "news":
+        return {**base, "title": f"Benchmark news {i}", "content": "Benchmark content. " * 10,
+                "status": "published", "author": "admin"}
+    if kind == "success_stories":
+        return {**base, "name": f"Story {i}", "story": "A story.", "image": "https://example.com/s.jpg",
+                "achievement": "Placed", "location": "Mumbai", "program": "Youth"}
+    if kind == "leadership_team":
+        return {**base, "name": f"Member {i}", "role": "Trustee", "image": "https://example.com/m.jpg",
+                "description": "Board member."}
+    if kind == "page_sections":
+        return {**base, "page": "about", "section": f"section-{i}", "title": f"Section {i}",
+                "content": {"text": "Section text."}}
+    if kind == "gallery_items":
+        return {**base, "title": f"Photo {i}", "description": "An event.", "image": "https://example.com/g.jpg",
+                "category": "events", "date": "2024-01-01", "type": "image"}
+    raise ValueError(kind)
+
+
+class Route:
+    def __init__(self, method, path, body=None, admin=False, name=None, pool=None):
+        self.method = method
+        self.path = path
+        self.body = body
+        self.admin = admin
+        self.name = name or f"{method} {path}"
+        # Collection whose disposable documents are consumed one per request
+        self.pool = pool
+
+
+CMS_KINDS = {
+    "news": "news",
+    "success-stories": "success_stories",
+    "leadership-team": "leadership_team",
+    "page-sections": "page_sections",
+    "gallery-items": "gallery_items",
+}
+
+
+# Items each reorder route moves; seeded per collection since not every one has synthetic data
+ORDER_ITEMS = 200
+# Contacts each bulk delete request removes
+BULK_DELETE_SIZE = 10
+ORDERED_IDS = {}
+
+
+def build_routes():
+    def unique(i):
+        return f"{i}.{uuid.uuid4().hex[:8]}"
+
+    routes = [
+        Route("GET", "/api/"),
+        Route("GET", "/api/news"),
+        Route("GET", "/api/impact-stats"),
+        Route("GET", "/api/site-content"),
+        Route("GET", "/api/site-content?since=1", name="GET /api/site-content?since"),
+        Route("GET", "/api/success-stories"),
+        Route("GET", "/api/leadership-team"),
+        Route("GET", "/api/page-sections/about"),
+        Route("GET", "/api/gallery-items"),
+        Route("GET", "/api/bundle/about"),
+        Route("POST", "/api/contact", body=lambda i: {
+            "name": "Bench Contact", "email": f"bench.{unique(i)}@example.com", "phone": None,
+            "subject": "Benchmark inquiry", "message": "Benchmark message body.", "inquiryType": "general"}),
+        Route("POST", "/api/volunteer", body=lambda i: {
+            "name": "Bench Volunteer", "email": f"bench.{unique(i)}@example.com", "phone": "5551234567",
+            "skills": "Benchmarking", "availability": "weekends", "interests": ["technology"], "experience": None}),
+        Route("POST", "/api/newsletter/subscribe", body=lambda i: {"email": f"bench.{unique(i)}@example.com"}),
+        Route("POST", "/api/admin/login", body=lambda i: {"username": "admin", "password": "admin123"}),
+        Route("GET", "/api/admin/contacts", admin=True),
+        Route("GET", "/api/admin/volunteers", admin=True),
+        Route("GET", "/api/admin/newsletters", admin=True),
+        Route("GET", "/api/admin/news", admin=True),
+        Route("GET", "/api/admin/site-content", admin=True),
+        Route("PUT", "/api/admin/impact-stats", admin=True, body=lambda i: {"youth_trained": 1300 + i}),
+        Route("PUT", "/api/admin/site-content", admin=True, body=lambda i: {"content": {"hero": {"title": f"Hero {i}"}}}),
+        Route("PATCH", "/api/admin/site-content", admin=True, body=lambda i: {"hero": {"subtitle": f"Subtitle {i}"}}),
+        Route("PUT", "/api/admin/contact-info", admin=True, body=lambda i: {"phone": f"+91 {i:010d}"}),
+        Route("GET", "/api/admin/database/stats", admin=True),
+        Route("GET", "/api/admin/database/collections", admin=True),
+        Route("GET", "/api/admin/database/contacts?limit=50", admin=True, name="GET /api/admin/database/{collection_name}"),
+        Route("DELETE", "/api/admin/database/contacts/{id}", admin=True, pool="contacts",
+              name="DELETE /api/admin/database/{collection_name}/{document_id}"),
+        Route("GET", "/api/metrics", admin=True),
+        # Triage of the last 30 days of contacts, cycling through the statuses
+        Route("POST", "/api/admin/contacts/bulk-status", admin=True, body=lambda i: {
+            "filter": {"created_after": (datetime.utcnow() - timedelta(days=30)).isoformat()},
+            "status": ["new", "responded", "closed"][i % 3]}),
+        Route("POST", "/api/admin/contacts/bulk-delete", admin=True, body=lambda i: {
+            "filter": {"email": f"bulk{i}@example.com"}}),
+    ]
+    for path, kind in CMS_KINDS.items():
+        create_body = disposable_document(kind, 0)
+        for field in ("id", "created_at", "updated_at", "author"):
+            create_body.pop(field, None)
+        if kind != "news":
+            routes.append(Route("GET", f"/api/admin/{path}" + ("/about" if kind == "page_sections" else ""), admin=True))
+        routes.append(Route("POST", f"/api/admin/{path}", admin=True, body=lambda i, b=create_body: b))
+        routes.append(Route("PUT", f"/api/admin/{path}/{{id}}", admin=True, pool=kind,
+                            body=lambda i: {"title": f"Updated title {i}"}))
+        routes.append(Route("DELETE", f"/api/admin/{path}/{{id}}", admin=True, pool=kind))
+        if kind != "news":
+            # Rotated by one each request, so every item moves
+            routes.append(Route("PATCH", f"/api/admin/{path}/order", admin=True, body=lambda i, k=kind: {
+                "ids": ORDERED_IDS[k][i % len(ORDERED_IDS[k]):] + ORDERED_IDS[k][:i % len(ORDERED_IDS[k])]}))
+    return routes
+
+
+async def run_route(client, route, headers, requests_count, concurrency, pools):
+    latencies = []
+    errors = 0
+    statuses = {}
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index, errors
+        while next_index < requests_count:
+            i = next_index
+            next_index += 1
+            path = route.path
+            if route.pool:
+                path = path.replace("{id}", pools[route.pool].pop())
+            started = time.perf_counter()
+            response = await client.request(
+                route.method, path,
+                json=route.body(i) if route.body else None,
+                headers=headers if route.admin else None,
+            )
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+
+    rss_before = rss_mb()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "rss_mb": round(rss_mb(), 1),
+        "rss_delta_mb": round(rss_mb() - rss_before, 1),
+    }
+
+
+def compare(results, baseline, tolerance: float) -> list:
+    """Print a comparison with a previous run and return the regressed routes"""
+    regressions = []
+    print(f"\n{'route':<62} {'p95 ms':>16} {'rps':>18}")
+    for name, current in results["routes"].items():
+        previous = baseline.get("routes", {}).get(name)
+        if not previous:
+            continue
+        p95_change = current["p95_ms"] / previous["p95_ms"] - 1 if previous["p95_ms"] else 0.0
+        rps_change = current["rps"] / previous["rps"] - 1 if previous["rps"] else 0.0
+        regressed = p95_change > tolerance or rps_change < -tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{'❌' if regressed else '  '} {name:<59} {previous['p95_ms']:>7}→{current['p95_ms']:<7} "
+              f"{previous['rps']:>8}→{current['rps']:<8}")
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent).stdout.strip() or None
+    except OSError:
+        return None
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, default="1k", help="Number of seeded contacts")
+    parser.add_argument("--contacts", type=int, help="Seed this many contacts instead of a preset scale")
+    parser.add_argument("--backend", choices=["mongod", "memory"], default="mongod",
+                        help="mongod uses MONGO_URL from backend/.env; memory needs mongomock-motor")
+    parser.add_argument("--db-name", default="shield_benchmark", help="Scratch database, dropped afterwards")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--routes", help="Only run routes whose name contains this text")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Previous results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed p95/rps change before a route counts as regressed")
+    parser.add_argument("--log-level", default="WARNING", help="App log level during the run")
+    args = parser.parse_args()
+    contacts = args.contacts if args.contacts is not None else SCALES[args.scale]
+
+    # Point the app at the scratch database before any module imports it
+    os.environ["DB_NAME"] = args.db_name
+    import database
+    if args.backend == "memory":
+        from mongomock_motor import AsyncMongoMockClient
+        database.client = AsyncMongoMockClient()
+        database.db = database.client[args.db_name]
+    db = database.db
+    await db.client.drop_database(args.db_name)
+
+    import httpx
+    from server import app
+    logging.getLogger().setLevel(args.log_level)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    print("=" * 70)
+    print(f"⏱  Shield Foundation API benchmark: {contacts} contacts, {args.backend}, "
+          f"{args.requests} requests/route, concurrency {args.concurrency}")
+    print("=" * 70)
+
+    started = time.perf_counter()
+    await load_dataset(db, DatasetSpec.for_contacts(contacts))
+    print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+    routes = [route for route in build_routes() if not args.routes or args.routes in route.name]
+    pools = {}
+    for route in routes:
+        if route.pool and route.pool not in pools:
+            documents = [disposable_document(route.pool, i) for i in range(args.requests * 2)]
+            await insert_batches(db[route.pool], documents, SEED_BATCH_SIZE, parallel=4)
+            pools[route.pool] = [document["id"] for document in documents]
+    if any(route.path.endswith("/bulk-delete") for route in routes):
+        documents = []
+        for i in range(args.requests):
+            for j in range(BULK_DELETE_SIZE):
+                document = disposable_document("contacts", i * BULK_DELETE_SIZE + j)
+                documents.append({**document, "email": f"bulk{i}@example.com"})
+        await insert_batches(db.contacts, documents, SEED_BATCH_SIZE, parallel=4)
+    for route in routes:
+        kind = route.name.split("/")[3] if route.path.endswith("/order") else None
+        if kind in CMS_KINDS:
+            documents = [disposable_document(CMS_KINDS[kind], i) for i in range(ORDER_ITEMS)]
+            await insert_batches(db[CMS_KINDS[kind]], documents, SEED_BATCH_SIZE, parallel=4)
+            ORDERED_IDS[CMS_KINDS[kind]] = [document["id"] for document in documents]
+
+    results = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "backend": args.backend,
+            "contacts": contacts,
+            "requests_per_route": args.requests,
+            "concurrency": args.concurrency,
+            "excluded_routes": EXCLUDED_ROUTES,
+        },
+        "routes": {},
+    }
+
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            login = await client.post("/api/admin/login", json={"username": "admin", "password": "admin123"})
+            headers = {"Authorization": f"Bearer {login.json()['token']}"}
+            if any("?since=" in route.path for route in routes):
+                # Fresh content is at version 0; ?since=1 only returns a delta from version 2 on
+                for i in range(2):
+                    await client.patch("/api/admin/site-content", headers=headers,
+                                       json={"hero": {"title": f"Seeded title {i}"}})
+            for route in routes:
+                stats = await run_route(client, route, headers, args.requests, args.concurrency, pools)
+                results["routes"][route.name] = stats
+                print(f"{'⚠️ ' if stats['errors'] else '  '} {route.name:<62} p50 {stats['p50_ms']:>8}ms  "
+                      f"p95 {stats['p95_ms']:>8}ms  p99 {stats['p99_ms']:>8}ms  {stats['rps']:>8} rps")
+    finally:
+        await app.router.shutdown()
+        if not args.keep:
+            await db.client.drop_database(args.db_name)
+
+    # Timings of failing requests measure the error path, so a run with errors is not a usable baseline
+    failed = [name for name, stats in results["routes"].items() if stats["errors"]]
+    results["meta"]["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    results["meta"]["routes_with_errors"] = failed
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"\nPeak RSS {results['meta']['peak_rss_mb']} MB; results saved to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} route(s) regressed beyond {args.tolerance:.0%}")
+        else:
+            print("\nNo regressions")
+    if failed:
+        print(f"\n{len(failed)} route(s) returned errors:")
+        for name in failed:
+            print(f"   {name}: {results['routes'][name]['statuses']}")
+    if regressions or failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
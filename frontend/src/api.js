@@ -87,6 +87,11 @@ export const api = {
 
     // Admin logout
     logout: () => {
+      // Revoke the token server-side; local logout proceeds regardless
+      const token = localStorage.getItem('adminToken');
+      if (token) {
+        apiClient.post('/admin/logout', null, { headers: { Authorization: `Bearer ${token}` } }).catch(() => {});
+      }
       localStorage.removeItem('adminToken');
       localStorage.removeItem('adminUser');
     },
@@ -111,7 +116,7 @@ export const api = {
 
     // Get all news (including drafts)
     getAllNews: async () => {
-      const response = await apiClient.get('/admin/news');
+      const response = await apiClient.get('/admin/news?all=true');
       return response.data;
     },
 
@@ -247,8 +252,12 @@ export const api = {
       return response.data;
     },
 
-    getCollectionData: async (collectionName, limit = 100, skip = 0) => {
-      const response = await apiClient.get(`/admin/database/${collectionName}?limit=${limit}&skip=${skip}`);
+    getCollectionData: async (collectionName, limit = 100, skip = 0, cursors = {}) => {
+      const params = { limit, skip };
+      // Use next_cursor / prev_cursor from the previous page for constant-time paging
+      if (cursors.after) params.after = cursors.after;
+      if (cursors.before) params.before = cursors.before;
+      const response = await apiClient.get(`/admin/database/${collectionName}`, { params });
       return response.data;
     },
 
@@ -317,4 +326,15 @@ export const getGalleryItems = async () => {
     console.error('Failed to fetch gallery items:', error);
     throw error;
   }
-};
\ No newline at end of file
+};
+
+// Page Bundle API (public) - everything a page renders in one request
+export const getPageBundle = async (page) => {
+  try {
+    const response = await apiClient.get(`/bundle/${page}`);
+    return response.data;
+  } catch (error) {
+    console.error(`Failed to fetch page bundle for ${page}:`, error);
+    throw error;
+  }
+};
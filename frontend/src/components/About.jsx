@@ -3,7 +3,7 @@ import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
 import { Badge } from './ui/badge';
 import { Heart, Users, Award, Target, Eye, Star, CheckCircle } from 'lucide-react';
 import { mockData } from '../mock';
-import { getPublicSiteContent, getLeadershipTeam } from '../api';
+import { getPageBundle } from '../api';
 import Header from './Header';
 import Footer from './Footer';
 
@@ -17,16 +17,16 @@ const About = () => {
   useEffect(() => {
     const loadData = async () => {
       try {
-        // Load site content
-        const backendContent = await getPublicSiteContent();
+        // Load site content and leadership team in one request
+        const bundle = await getPageBundle('about');
+        const backendContent = bundle.site_content;
         if (backendContent.content && Object.keys(backendContent.content).length > 0) {
           setSiteContent(backendContent.content);
         } else {
           setSiteContent(mockData.siteContent || {});
         }
 
-        // Load leadership team
-        const teamData = await getLeadershipTeam();
+        const teamData = bundle.leadership_team;
         if (teamData.members && teamData.members.length > 0) {
           setTeamMembers(teamData.members);
         } else {
@@ -6,7 +6,7 @@ import { Input } from './ui/input';
 import { Textarea } from './ui/textarea';
 import { useToast } from '../hooks/use-toast';
 import { Heart, Users, GraduationCap, Award, Phone, Mail, MapPin, ArrowRight, CheckCircle } from 'lucide-react';
-import { api, getPublicSiteContent } from '../api';
+import { api, getPageBundle } from '../api';
 import { mockData } from '../mock';
 import Header from './Header';
 import Footer from './Footer';
@@ -26,29 +26,29 @@ const Homepage = () => {
 
   // Site content state
   const [siteContent, setSiteContent] = useState({});
+  // Success stories state (null until the page bundle has loaded)
+  const [successStories, setSuccessStories] = useState(null);
 
-  // Load site content and impact statistics on component mount
+  // Load site content, impact statistics and success stories on component mount
   useEffect(() => {
     const loadData = async () => {
       try {
-        // Load impact statistics
-        const stats = await api.getImpactStats();
-        setImpactStats(stats);
-        
-        // Load site content - try public API first, fallback to mock data
-        try {
-          const backendContent = await getPublicSiteContent();
-          if (backendContent.content && Object.keys(backendContent.content).length > 0) {
-            setSiteContent(backendContent.content);
-          } else {
-            setSiteContent(mockData.siteContent || {});
-          }
-        } catch (error) {
-          console.log('Using mock data for site content');
+        // Load everything the homepage renders in one request
+        const bundle = await getPageBundle('home');
+        setImpactStats(bundle.impact_stats);
+        setSuccessStories(bundle.success_stories.stories || []);
+
+        // Use backend site content if present, fallback to mock data
+        const backendContent = bundle.site_content;
+        if (backendContent.content && Object.keys(backendContent.content).length > 0) {
+          setSiteContent(backendContent.content);
+        } else {
           setSiteContent(mockData.siteContent || {});
         }
       } catch (error) {
         console.error('Failed to load homepage data:', error);
+        setSiteContent(mockData.siteContent || {});
+        setSuccessStories([]);
       }
     };
     
@@ -303,7 +303,7 @@ const Homepage = () => {
       </section>
 
       {/* Success Stories Carousel */}
-      <SuccessStoriesCarousel />
+      <SuccessStoriesCarousel stories={successStories} />
 
       {/* Contact Section */}
       <section className="py-20 bg-blue-600 text-white">
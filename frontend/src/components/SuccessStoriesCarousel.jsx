@@ -4,13 +4,22 @@ import { Button } from './ui/button';
 import { ChevronLeft, ChevronRight, MapPin, Award } from 'lucide-react';
 import { getSuccessStories } from '../api';
 
-const SuccessStoriesCarousel = () => {
+const SuccessStoriesCarousel = ({ stories: providedStories }) => {
   const [stories, setStories] = useState([]);
   const [currentIndex, setCurrentIndex] = useState(0);
   const [loading, setLoading] = useState(true);
 
-  // Load success stories on component mount
+  // Load success stories on component mount, unless the parent supplies them
+  // (null means the parent is still loading them)
   useEffect(() => {
+    if (providedStories !== undefined) {
+      if (providedStories !== null) {
+        setStories(providedStories);
+        setLoading(false);
+      }
+      return;
+    }
+
     const loadStories = async () => {
       try {
         const data = await getSuccessStories();
@@ -24,7 +33,7 @@ const SuccessStoriesCarousel = () => {
     };
 
     loadStories();
-  }, []);
+  }, [providedStories]);
 
   // Auto-advance carousel
   useEffect(() => {
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Newsletter Subscription Load Test for Shield Foundation
+Compares the previous find-then-write signup path with the atomic upsert
+used by /api/newsletter/subscribe under concurrent signups.
+
+Runs directly against MongoDB (MONGO_URL / DB_NAME from backend/.env) in a
+scratch collection that is dropped afterwards.
+"""
+
+import asyncio
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from pymongo.errors import DuplicateKeyError
+from database import db
+from models import Newsletter
+from server import subscribe_to_newsletter
+
+SCRATCH_COLLECTION = "newsletter_load_test"
+
+
+async def legacy_subscribe(collection, email: str) -> str:
+    """The previous two-round-trip subscription path"""
+    existing = await collection.find_one({"email": email})
+    if existing:
+        if existing.get("is_active"):
+            return "already_subscribed"
+        await collection.update_one(
+            {"email": email},
+            {"$set": {"is_active": True, "subscribed_at": datetime.utcnow()}}
+        )
+        return "reactivated"
+    await collection.insert_one(Newsletter(email=email).dict())
+    return "subscribed"
+
+
+async def run_signups(subscribe, collection, emails, concurrency: int):
+    """Run every signup with at most `concurrency` in flight; return (seconds, outcomes)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes = {}
+
+    async def signup(email):
+        async with semaphore:
+            try:
+                outcome = await subscribe(collection, email)
+            except DuplicateKeyError:
+                outcome = "duplicate_key_error"
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(signup(email) for email in emails))
+    return time.perf_counter() - started, outcomes
+
+
+async def benchmark(name, subscribe, emails, inactive, concurrency):
+    collection = db[SCRATCH_COLLECTION]
+    await collection.drop()
+    await collection.create_index("email", unique=True)
+    # Pre-seed unsubscribed emails so the reactivation path is exercised too
+    if inactive:
+        await collection.insert_many([
+            {**Newsletter(email=email).dict(), "is_active": False} for email in inactive
+        ])
+
+    elapsed, outcomes = await run_signups(subscribe, collection, emails, concurrency)
+    await collection.drop()
+
+    print(f"{name:>8}: {len(emails) / elapsed:8.0f} signups/s  ({elapsed:.2f}s)  {outcomes}")
+    return len(emails) / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signups", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--unique-emails", type=int, default=2000,
+                        help="Distinct addresses; fewer than --signups makes concurrent duplicates")
+    args = parser.parse_args()
+
+    random.seed(42)
+    pool = [f"load.test.{i}@example.com" for i in range(args.unique_emails)]
+    emails = [random.choice(pool) for _ in range(args.signups)]
+    inactive = pool[: args.unique_emails // 10]
+
+    print("=" * 60)
+    print(f"📨 Newsletter signup load test: {args.signups} signups, "
+          f"{args.unique_emails} addresses, concurrency {args.concurrency}")
+    print("=" * 60)
+    legacy = await benchmark("legacy", legacy_subscribe, emails, inactive, args.concurrency)
+    atomic = await benchmark("atomic", subscribe_to_newsletter, emails, inactive, args.concurrency)
+    print(f"Throughput gain: {atomic / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
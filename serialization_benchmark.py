@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization Benchmark for Shield Foundation
+Compares FastAPI's default response path (handler-side .isoformat() and
+str(ObjectId), then jsonable_encoder + json.dumps) with the serializers in
+backend/serialization.py on admin contacts and public gallery payloads.
+Checks that every serializer produces byte-identical output.
+
+Runs entirely in memory; no database needed.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+import serialization
+from synthetic_data import DatasetSpec, DocumentFactory
+
+
+def contacts_payload(factory, count):
+    """What GET /api/admin/contacts renders, with native datetimes"""
+    return [{
+        "id": contact["id"], "name": contact["name"], "email": contact["email"], "phone": contact["phone"],
+        "subject": contact["subject"], "message": contact["message"], "inquiry_type": contact["inquiry_type"],
+        "created_at": contact["created_at"], "status": contact["status"],
+    } for contact in (factory.contact(i) for i in range(count))]
+
+
+def gallery_payload(factory, count):
+    """What GET /api/gallery-items renders: raw documents including _id"""
+    return {"items": [{"_id": ObjectId(), **factory.gallery_item(i)} for i in range(count)]}
+
+
+def default_path(payload):
+    """The previous path: stringify in the handler, then jsonable_encoder + json.dumps"""
+    def prepare(value):
+        if isinstance(value, dict):
+            return {key: prepare(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [prepare(item) for item in value]
+        if isinstance(value, ObjectId):
+            return str(value)
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
+    return JSONResponse(jsonable_encoder(prepare(payload))).body
+
+
+def measure(func, payload, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", type=int, default=500, help="Contacts per payload (one max-size page)")
+    parser.add_argument("--gallery-items", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    factory = DocumentFactory(DatasetSpec())
+    payloads = {
+        f"contacts x{args.contacts}": contacts_payload(factory, args.contacts),
+        f"gallery x{args.gallery_items}": gallery_payload(factory, args.gallery_items),
+    }
+    serializers = {"default": default_path, "stdlib": serialization.dumps_stdlib}
+    if serialization.orjson is not None:
+        serializers["orjson"] = serialization.dumps_orjson
+
+    print("=" * 70)
+    print(f"🚀 JSON serialization benchmark (best of {args.repeat}; active: {serialization.JSON_SERIALIZER})")
+    print("=" * 70)
+    for name, payload in payloads.items():
+        expected = default_path(payload)
+        timings = {serializer_name: measure(func, payload, args.repeat)
+                   for serializer_name, func in serializers.items()}
+        print(f"{name} ({len(expected) / 1024:.0f} KiB)")
+        for serializer_name, func in serializers.items():
+            elapsed = timings[serializer_name]
+            identical = "" if func(payload) == expected else "  ⚠️ output differs"
+            print(f"  {serializer_name:<8} {elapsed * 1000:8.2f} ms  {timings['default'] / elapsed:6.1f}x{identical}")
+
+
+if __name__ == "__main__":
+    main()
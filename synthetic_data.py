@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator for Shield Foundation
+Bulk-loads realistic contacts, volunteers, newsletter subscriptions, news,
+gallery items and page sections built from the models in backend/models.py,
+for scale testing the admin lists, pagination and benchmarks.
+
+Documents are generated lazily and written with unordered insert_many
+batches, several in flight at once, so a million documents load in minutes.
+Writes to MONGO_URL / DB_NAME from backend/.env unless --db-name is given.
+
+Examples:
+    python synthetic_data.py --scale 100k --drop
+    python synthetic_data.py --contacts 1000000 --volunteers 0 --recency-skew 4
+"""
+
+import asyncio
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+from pydantic import BaseModel, ValidationError, validator
+
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from models import Contact, Volunteer, Newsletter, News, GalleryItem, PageSection, CONTACT_STATUSES, VOLUNTEER_STATUSES
+
+FIRST_NAMES = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Sneha", "Arjun", "Kavya", "Rahul", "Meera",
+               "Sarah", "Michael", "Fatima", "David", "Aisha", "Joseph", "Lakshmi", "Imran", "Neha", "Suresh"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Khan", "Reddy", "Nair", "Gupta", "Das", "Mehta", "Singh",
+              "Johnson", "Chen", "Fernandes", "D'Souza", "Joshi", "Kulkarni", "Pillai", "Rao", "Bose", "Shah"]
+EMAIL_DOMAINS = ["gmail.com", "yahoo.co.in", "outlook.com", "example.org", "hotmail.com"]
+CITIES = ["Mumbai", "Pune", "Thane", "Navi Mumbai", "Nashik", "Bengaluru", "Delhi", "Chennai"]
+INQUIRY_TYPES = {"general": 0.5, "volunteer": 0.2, "partnership": 0.15, "donation": 0.15}
+SUBJECTS = ["Inquiry about youth training programs", "Partnership opportunity", "Volunteering question",
+            "Donation receipt request", "Senior care services", "Placement support for my son",
+            "Corporate CSR collaboration", "Event participation"]
+MESSAGE_SENTENCES = [
+    "I came across your work through a friend and would like to know more.",
+    "Could you share details about the next batch and the eligibility criteria?",
+    "Our company is looking for a CSR partner in the skilling space.",
+    "My grandmother could benefit from your senior support programme.",
+    "Please let me know how I can contribute on weekends.",
+    "We would like to sponsor equipment for one of your centres.",
+    "Is there a fee for the training, and are certificates provided?",
+    "Thank you for the wonderful work you are doing in the community.",
+]
+VOLUNTEER_SKILLS = ["Teaching", "Mentoring", "Web development", "Event management", "Fundraising",
+                    "Counselling", "Photography", "Accounting", "Social media", "First aid"]
+AVAILABILITY = {"weekdays": 0.2, "weekends": 0.45, "flexible": 0.25, "monthly": 0.1}
+INTERESTS = ["youth", "seniors", "events", "fundraising", "admin"]
+GALLERY_CATEGORIES = {"youth": 0.35, "seniors": 0.3, "events": 0.2, "community": 0.15}
+PAGES = ["homepage", "about", "programs", "impact", "gallery"]
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def check_statuses(weights: Dict[str, float], allowed: list) -> Dict[str, float]:
+    unknown = [status for status in weights if status not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown statuses {', '.join(unknown)}; must be among {', '.join(allowed)}")
+    return weights
+
+
+class DatasetSpec(BaseModel):
+    """How many documents of each kind to load, and how they are distributed"""
+    contacts: int = 1000
+    volunteers: int = 250
+    newsletters: int = 500
+    news: int = 50
+    gallery_items: int = 50
+    page_sections: int = 40
+    # created_at values fall within the last `days` days
+    days: int = 730
+    # 0 spreads documents evenly over time; higher values pack more into recent weeks
+    recency_skew: float = 2.0
+    # Keys must be statuses the app uses, so seeded data can be triaged through the bulk-status API
+    contact_statuses: Dict[str, float] = dict(zip(CONTACT_STATUSES, (0.5, 0.3, 0.2)))
+    volunteer_statuses: Dict[str, float] = dict(zip(VOLUNTEER_STATUSES, (0.6, 0.3, 0.1)))
+    inactive_newsletter_ratio: float = 0.1
+    published_news_ratio: float = 0.7
+    seed: int = 42
+
+    @validator('contact_statuses')
+    def validate_contact_statuses(cls, v):
+        return check_statuses(v, CONTACT_STATUSES)
+
+    @validator('volunteer_statuses')
+    def validate_volunteer_statuses(cls, v):
+        return check_statuses(v, VOLUNTEER_STATUSES)
+
+    @classmethod
+    def for_contacts(cls, contacts: int, **overrides):
+        """Scale every collection in proportion to the number of contacts"""
+        return cls(**{
+            "contacts": contacts,
+            "volunteers": contacts // 4,
+            "newsletters": contacts // 2,
+            "news": min(max(contacts // 100, 50), 5000),
+            "gallery_items": min(max(contacts // 500, 50), 2000),
+            **overrides,
+        })
+
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """Parse "new=0.5,responded=0.3" into a weight mapping"""
+    weights = {}
+    for part in text.split(","):
+        key, _, value = part.partition("=")
+        weights[key.strip()] = float(value)
+    return weights
+
+
+class DocumentFactory:
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.now = datetime.utcnow()
+
+    def pick(self, weights: Dict[str, float]) -> str:
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def timestamp(self) -> datetime:
+        age = self.rng.random() ** (1 + self.spec.recency_skew)
+        return self.now - timedelta(seconds=age * self.spec.days * 86400)
+
+    def person(self, i: int):
+        first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+        # The index keeps emails unique, which the newsletter index requires
+        local = f"{first}.{last}".lower().replace("'", "")
+        return f"{first} {last}", f"{local}.{i}@{self.rng.choice(EMAIL_DOMAINS)}"
+
+    def phone(self) -> str:
+        return f"+91 {self.rng.randint(70000, 99999)} {self.rng.randint(10000, 99999)}"
+
+    def paragraph(self, sentences: int) -> str:
+        return " ".join(self.rng.choice(MESSAGE_SENTENCES) for _ in range(sentences))
+
+    def contact(self, i: int) -> dict:
+        name, email = self.person(i)
+        return Contact(
+            name=name, email=email, phone=self.phone() if self.rng.random() < 0.7 else None,
+            subject=self.rng.choice(SUBJECTS), message=self.paragraph(self.rng.randint(1, 4)),
+            inquiry_type=self.pick(INQUIRY_TYPES), created_at=self.timestamp(),
+            status=self.pick(self.spec.contact_statuses),
+        ).dict()
+
+    def volunteer(self, i: int) -> dict:
+        name, email = self.person(i)
+        return Volunteer(
+            name=name, email=email, phone=self.phone(),
+            skills=", ".join(self.rng.sample(VOLUNTEER_SKILLS, self.rng.randint(1, 3))),
+            availability=self.pick(AVAILABILITY),
+            interests=self.rng.sample(INTERESTS, self.rng.randint(1, 3)),
+            experience=self.paragraph(1) if self.rng.random() < 0.5 else None,
+            created_at=self.timestamp(), status=self.pick(self.spec.volunteer_statuses),
+        ).dict()
+
+    def newsletter(self, i: int) -> dict:
+        _, email = self.person(i)
+        return Newsletter(
+            email=email, subscribed_at=self.timestamp(),
+            is_active=self.rng.random() >= self.spec.inactive_newsletter_ratio,
+        ).dict()
+
+    def news_item(self, i: int) -> dict:
+        created_at = self.timestamp()
+        return News(
+            title=f"{self.rng.choice(CITIES)} centre update #{i}",
+            content="\n\n".join(self.paragraph(5) for _ in range(self.rng.randint(2, 6))),
+            status="published" if self.rng.random() < self.spec.published_news_ratio else "draft",
+            author="admin", created_at=created_at, updated_at=created_at,
+        ).dict()
+
+    def gallery_item(self, i: int) -> dict:
+        created_at = self.timestamp()
+        return GalleryItem(
+            id=str(uuid.uuid4()), title=f"{self.rng.choice(CITIES)} event {i}",
+            description=self.paragraph(1), image=f"https://images.example.org/gallery/{i}.jpg",
+            category=self.pick(GALLERY_CATEGORIES), date=created_at.strftime("%Y-%m-%d"),
+            type="video" if self.rng.random() < 0.1 else "image", order=i,
+            created_at=created_at, updated_at=created_at,
+        ).dict()
+
+    def page_section(self, i: int) -> dict:
+        created_at = self.timestamp()
+        return PageSection(
+            id=str(uuid.uuid4()), page=PAGES[i % len(PAGES)], section=f"section-{i}",
+            title=f"Section {i}", content={"text": self.paragraph(3), "items": [self.paragraph(1)] * 3},
+            order=i // len(PAGES), created_at=created_at, updated_at=created_at,
+        ).dict()
+
+
+async def insert_batches(collection, documents, batch_size: int, parallel: int) -> int:
+    """Write documents with unordered insert_many, keeping up to `parallel` batches in flight"""
+    semaphore = asyncio.Semaphore(parallel)
+    tasks = []
+    written = 0
+
+    async def write(batch):
+        nonlocal written
+        try:
+            await collection.insert_many(batch, ordered=False)
+            written += len(batch)
+        finally:
+            semaphore.release()
+
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(write(batch)))
+            batch = []
+    if batch:
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(write(batch)))
+    await asyncio.gather(*tasks)
+    return written
+
+
+async def load_dataset(db, spec: DatasetSpec, batch_size: int = 2000, parallel: int = 4,
+                       drop: bool = False, log=print) -> dict:
+    """Generate and insert the dataset; returns documents written per collection"""
+    factory = DocumentFactory(spec)
+    plan = [
+        ("contacts", spec.contacts, factory.contact),
+        ("volunteers", spec.volunteers, factory.volunteer),
+        ("newsletters", spec.newsletters, factory.newsletter),
+        ("news", spec.news, factory.news_item),
+        ("gallery_items", spec.gallery_items, factory.gallery_item),
+        ("page_sections", spec.page_sections, factory.page_section),
+    ]
+    written = {}
+    for collection_name, count, make in plan:
+        if drop:
+            await db[collection_name].delete_many({})
+        if count <= 0:
+            continue
+        started = time.perf_counter()
+        written[collection_name] = await insert_batches(
+            db[collection_name], (make(i) for i in range(count)), batch_size, parallel
+        )
+        elapsed = time.perf_counter() - started
+        log(f"  {collection_name:<14} {written[collection_name]:>9} documents  "
+            f"{elapsed:7.1f}s  {written[collection_name] / elapsed:9.0f} docs/s")
+    return written
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, help="Preset sized by number of contacts")
+    for field in ("contacts", "volunteers", "newsletters", "news", "gallery_items", "page_sections"):
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, dest=field)
+    parser.add_argument("--days", type=int, help="Spread created_at over this many days")
+    parser.add_argument("--recency-skew", type=float, help="0 = uniform; higher = more recent documents")
+    parser.add_argument("--contact-statuses", type=parse_weights, help='e.g. "new=0.5,responded=0.3,closed=0.2"')
+    parser.add_argument("--volunteer-statuses", type=parse_weights, help='e.g. "pending=0.6,approved=0.4"')
+    parser.add_argument("--inactive-newsletter-ratio", type=float)
+    parser.add_argument("--published-news-ratio", type=float)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--parallel", type=int, default=4, help="insert_many batches in flight")
+    parser.add_argument("--db-name", help="Target database instead of DB_NAME")
+    parser.add_argument("--drop", action="store_true", help="Empty the target collections first")
+    args = parser.parse_args()
+
+    overrides = {field: value for field, value in vars(args).items()
+                 if field in DatasetSpec.model_fields and value is not None}
+    try:
+        if args.scale:
+            spec = DatasetSpec.for_contacts(SCALES[args.scale], **overrides)
+        else:
+            spec = DatasetSpec(**overrides)
+    except ValidationError as e:
+        parser.error(str(e))
+
+    if args.db_name:
+        os.environ["DB_NAME"] = args.db_name
+    from database import db
+
+    total = spec.contacts + spec.volunteers + spec.newsletters + spec.news + spec.gallery_items + spec.page_sections
+    print("=" * 60)
+    print(f"🧪 Loading {total} synthetic documents into {db.name}")
+    print("=" * 60)
+    started = time.perf_counter()
+    await load_dataset(db, spec, args.batch_size, args.parallel, args.drop)
+    elapsed = time.perf_counter() - started
+    print(f"Done in {elapsed:.1f}s ({total / elapsed:.0f} docs/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())